@@ -12,6 +12,15 @@ import wx
 _ = gettext.translation("treemendous", fallback=True).gettext
 
 
+def show_last_item(menu, item, show):
+    "Adds item to the end of menu, or removes it (without destroying it), so the menu can be reused."
+    shown = menu.FindItemById(item.GetId()) is not None
+    if show and not shown:
+        menu.Append(item)
+    elif shown and not show:
+        menu.Remove(item)
+
+
 class AddNodeMenu(wx.Menu):
     def __init__(self, parent):
         super().__init__()
@@ -39,19 +48,25 @@ class AddNodeMenu(wx.Menu):
         self.Append(parent)
         self.Bind(wx.EVT_MENU, self.OnParent, parent)
 
-        if self.parent.tree.selection != self.parent.tree.root:
-            sibling = wx.MenuItem(
-                self,
-                wx.ID_ANY,
-                # Translators: The option for adding a sibling in the add node pop-up menu.
-                _("&Sibling"),
-                _(
-                    # Translators: Help text in the add node pop-up menu.
-                    "Add a new node as an immediate sibling (same level) of the current selection"
-                ),
-            )
-            self.Append(sibling)
-            self.Bind(wx.EVT_MENU, self.OnSibling, sibling)
+        self.sibling = wx.MenuItem(
+            self,
+            wx.ID_ANY,
+            # Translators: The option for adding a sibling in the add node pop-up menu.
+            _("&Sibling"),
+            _(
+                # Translators: Help text in the add node pop-up menu.
+                "Add a new node as an immediate sibling (same level) of the current selection"
+            ),
+        )
+        self.Append(self.sibling)
+        self.Bind(wx.EVT_MENU, self.OnSibling, self.sibling)
+
+    def Prepare(self):
+        "Updates the menu for the current selection before it is shown."
+        # The root has no siblings.
+        show_last_item(
+            self, self.sibling, self.parent.tree.selection != self.parent.tree.root
+        )
 
     def OnChild(self, event):
         return self.parent.DoAddChild()
@@ -64,7 +79,7 @@ class AddNodeMenu(wx.Menu):
 
 
 class PasteDestMenu(wx.Menu):
-    def __init__(self, parent, event):
+    def __init__(self, parent, event=None):
         super().__init__()
         self.parent = parent
         self.event = event
@@ -91,19 +106,26 @@ class PasteDestMenu(wx.Menu):
         self.Append(parent)
         self.Bind(wx.EVT_MENU, self.OnParent, parent)
 
-        if self.parent.tree.selection != self.parent.tree.root:
-            sibling = wx.MenuItem(
-                self,
-                wx.ID_ANY,
-                # Translators: An option in the paste pop-up menu.
-                _("As &sibling"),
-                _(
-                    # Translators: Help text in the paste pop-up menu.
-                    "Paste as an immediate sibling (same level) of the current selection"
-                ),
-            )
-            self.Append(sibling)
-            self.Bind(wx.EVT_MENU, self.OnSibling, sibling)
+        self.sibling = wx.MenuItem(
+            self,
+            wx.ID_ANY,
+            # Translators: An option in the paste pop-up menu.
+            _("As &sibling"),
+            _(
+                # Translators: Help text in the paste pop-up menu.
+                "Paste as an immediate sibling (same level) of the current selection"
+            ),
+        )
+        self.Append(self.sibling)
+        self.Bind(wx.EVT_MENU, self.OnSibling, self.sibling)
+
+    def Prepare(self, event):
+        "Updates the menu for the current selection and paste event before it is shown."
+        self.event = event
+        # The root has no siblings.
+        show_last_item(
+            self, self.sibling, self.parent.tree.selection != self.parent.tree.root
+        )
 
     def OnChild(self, event):
         return self.parent.PasteChild(self.event)
@@ -120,9 +142,9 @@ class NodeContextMenu(wx.Menu):
         super().__init__()
         self.parent = parent
 
-        addSubmenu = AddNodeMenu(parent)
+        self.addSubmenu = AddNodeMenu(parent)
         self.AppendSubMenu(
-            addSubmenu,
+            self.addSubmenu,
             # Translators: An item in the node context (shift+f10) menu.
             _("&Add node"),
             help=_(
@@ -173,6 +195,10 @@ class NodeContextMenu(wx.Menu):
         )
         self.Append(delsubtree)
 
+    def Prepare(self):
+        "Updates the menu for the current selection before it is shown."
+        self.addSubmenu.Prepare()
+
     def OnUp(self, event):
         return self.parent.OnMoveUp(event)
 
@@ -6,9 +6,12 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
+import os
+import tempfile
 import unittest
+import zipfile
 
-from tree import Node
+from tree import Location, Node, Tree
 
 
 class TestNode(unittest.TestCase):
@@ -97,6 +100,40 @@ class TestNode(unittest.TestCase):
         self.assertNotIn(np, dp.children)
         self.assertNotIn(n, dp.children)
 
+    def test_delete_then_add_parent(self):
+        vp = Node(label="VP")
+        v = Node(label="V", value="touch")
+        dp = Node(label="DP")
+        vp.add_child(v)
+        vp.add_child(dp)
+        v.delete()
+        np = Node(label="NP")
+        dp.add_parent(np)
+        self.assertEqual(vp.children, [np])
+        self.assertEqual(np.children, [dp])
+
+    def test_shift(self):
+        tp = Node(label="TP")
+        dp = Node(label="DP")
+        tbar = Node(label="T<bar/>")
+        tp.add_child(dp)
+        tp.add_child(tbar)
+        dp.shift(1)
+        self.assertEqual(tp.children, [tbar, dp])
+        dp.shift(-1)
+        self.assertEqual(tp.children, [dp, tbar])
+
+    def test_shift_clamped(self):
+        tp = Node(label="TP")
+        dp = Node(label="DP")
+        tbar = Node(label="T<bar/>")
+        tp.add_child(dp)
+        tp.add_child(tbar)
+        dp.shift(-1)
+        self.assertEqual(tp.children, [dp, tbar])
+        tbar.shift(1)
+        self.assertEqual(tp.children, [dp, tbar])
+
     def test_delete_root(self):
         n = Node()
         with self.assertRaises(AssertionError):
@@ -155,6 +192,29 @@ class TestNode(unittest.TestCase):
         tp.add_child(tbar)
         self.assertEqual(tp.to_dict(), TestNode.SIMPLE_TREE_DICT)
 
+    def test_dict_round_trip_deep(self):
+        root = n = Node(label="root")
+        for i in range(5000):
+            c = Node(label=str(i))
+            n.add_child(c)
+            n = c
+        n = Node.from_dict(root.to_dict())
+        self.assertEqual(n.label, "root")
+        for i in range(5000):
+            self.assertEqual(len(n.children), 1)
+            self.assertEqual(n.children[0].parent, n)
+            n = n.children[0]
+            self.assertEqual(n.label, str(i))
+        self.assertEqual(len(n.children), 0)
+
+    def test_copy(self):
+        tp = Node.from_dict(TestNode.SIMPLE_TREE_DICT)
+        c = tp.children[0].copy()
+        self.assertIsNone(c.parent)
+        self.assertEqual(c.to_dict(), TestNode.SIMPLE_TREE_DICT["children"][0])
+        c.label = "NP"
+        self.assertEqual(tp.children[0].label, "DP")
+
     def test_qtree_simple(self):
         self.assertEqual(
             Node.from_dict(TestNode.SIMPLE_TREE_DICT).to_qtree(), TestNode.SIMPLE_QTREE
@@ -174,6 +234,92 @@ class TestNode(unittest.TestCase):
     def test_qtree_bold_unopened(self):
         self.assertEqual(Node(label="root</b>").to_qtree(), "\Tree [.root</b>\n]\n")
 
+    def test_qtree_nested_math(self):
+        self.assertEqual(
+            Node(label="x<sub>1<sup>2</sup></sub>").to_qtree(),
+            "\Tree [.x$_{1^{2}}$\n]\n",
+        )
+
+    def test_qtree_misnested(self):
+        self.assertEqual(
+            Node(label="<b><i>root</b></i>").to_qtree(),
+            "\Tree [.<b><i>root</b></i>\n]\n",
+        )
+
+    def test_qtree_stray_bracket(self):
+        self.assertEqual(Node(label="a < b").to_qtree(), "\Tree [.a < b\n]\n")
+
+
+class TestTree(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "test.treemendous")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_save_load_round_trip(self):
+        t = Tree()
+        t.add(Location.CHILD, "TP")
+        t.add(Location.CHILD, "DP")
+        t.notes = "I touch the cactus"
+        t.save(self.path)
+        self.assertFalse(t.dirty)
+        loaded = Tree(self.path)
+        self.assertEqual(loaded.root.to_dict(), t.root.to_dict())
+        self.assertEqual(loaded.notes, "I touch the cactus")
+        self.assertEqual(loaded.last_path, self.path)
+
+    def test_copy_paste(self):
+        t = Tree()
+        t.add(Location.CHILD, "TP")
+        t.add(Location.CHILD, "DP")
+        t.copy()
+        t.selection.label = "NP"
+        t.paste(Location.SIBLING)
+        t.paste(Location.SIBLING)
+        self.assertEqual([c.label for c in t.root.children], ["NP", "DP", "DP"])
+        self.assertIsNot(t.root.children[1], t.root.children[2])
+
+    def test_save_after_notes_change(self):
+        t = Tree()
+        t.add(Location.CHILD, "TP")
+        t.notes = "first"
+        t.save(self.path)
+        t.notes = "second"
+        t.save(self.path)
+        self.assertEqual(Tree(self.path).notes, "second")
+
+    def test_qtree_after_edit(self):
+        t = Tree()
+        t.add(Location.CHILD, "TP")
+        t.add(Location.CHILD, "DP")
+        self.assertIs(t.qtree(), t.qtree())
+        t.edit(label="NP")
+        self.assertIn("NP", t.qtree())
+        t.move_up()
+        t.delete()
+        self.assertNotIn("NP", t.qtree())
+
+    def test_move_by(self):
+        t = Tree()
+        t.add(Location.CHILD, "TP")
+        for label in ("DP", "T'", "PP"):
+            t.add(Location.CHILD, label)
+            t.selection = t.root
+        t.selection = t.root.children[2]
+        t.move_by(-2)
+        self.assertEqual([c.label for c in t.root.children], ["PP", "DP", "T'"])
+        t.move_by(5)
+        self.assertEqual([c.label for c in t.root.children], ["DP", "T'", "PP"])
+        self.assertTrue(t.dirty)
+
+    def test_load_lzma(self):
+        with zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_LZMA) as zip:
+            zip.writestr("tree.json", '{"label": "TP", "children": []}')
+            zip.writestr("manifest.json", '{"version": "1.0.0"}')
+        self.assertEqual(Tree(self.path).root.label, "TP")
+
 
 if __name__ == "__main__":
     unittest.main()
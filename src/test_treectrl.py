@@ -0,0 +1,317 @@
+"""
+Unit tests for the platform-independent parts of the treectrl module.
+Copyright 2021 Bill Dengler and open-source contributors
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+import itertools
+import unittest
+
+try:
+    import wx  # Needed to import treectrl, though the fake control below never touches it
+except ImportError:
+    raise unittest.SkipTest("wxPython is not installed")
+
+from tree import Location, Node, Tree
+from treectrl import TreeCTRL, _increasing_run
+
+
+class Everything:
+    "An expanded collection containing every node, so that every branch is loaded."
+
+    def __contains__(self, node):
+        return True
+
+
+class FakeItem:
+    _ids = itertools.count(1)
+
+    def __init__(self, label):
+        self.id = next(self._ids)
+        self.label = label
+        self.parent = None
+        self.children = []
+
+    def GetID(self):
+        return self.id
+
+
+class FakeWidget:
+    def Freeze(self):
+        pass
+
+    def Thaw(self):
+        pass
+
+
+class FakeTreeCTRL(TreeCTRL):
+    "Keeps its items in memory and records every change made to them."
+
+    SupportsInsert = True
+
+    def __init__(self):
+        super().__init__()
+        self.top = None
+        self.calls = []
+        self._widget = FakeWidget()
+
+    @property
+    def widget(self):
+        return self._widget
+
+    def AddRoot(self, node, expanded):
+        self.top = FakeItem(str(node))
+        self.calls.append(("AddRoot", str(node)))
+        return self._RememberNode(self.top, node)
+
+    def AddChild(self, rootitm, node, expanded):
+        return self.AddChildren(rootitm, [node], expanded)[0]
+
+    def AddChildren(self, rootitm, nodes, expanded, labels=None):
+        items = self._Insert(rootitm, len(rootitm.children), nodes)
+        self.calls.extend(("Append", itm.label) for itm in items)
+        return items
+
+    def InsertChildren(self, rootitm, pos, nodes, expanded, labels=None):
+        items = self._Insert(rootitm, pos, nodes)
+        self.calls.extend(("Insert", itm.label) for itm in items)
+        return items
+
+    def _Insert(self, rootitm, pos, nodes):
+        items = []
+        for offset, node in enumerate(nodes):
+            itm = FakeItem(str(node))
+            itm.parent = rootitm
+            rootitm.children.insert(pos + offset, itm)
+            items.append(self._RememberNode(itm, node))
+        return items
+
+    def BindEvent(self, evt, handler):
+        pass
+
+    def DeleteAll(self):
+        self._nodes.clear()
+        self._shown.clear()
+        self._root = None
+        self.top = None
+        self.calls.append(("DeleteAll",))
+
+    def DeleteItem(self, itm):
+        itm.parent.children.remove(itm)
+        self.calls.append(("Delete", itm.label))
+
+    def SetItemText(self, itm, text):
+        itm.label = text
+        self.calls.append(("SetItemText", text))
+
+    def CollapseChildren(self, itm):
+        pass
+
+    def Select(self, itm):
+        pass
+
+
+class FakeAppendTreeCTRL(FakeTreeCTRL):
+    "Like MacTreeCTRL, can only append items, and leaves can't become containers."
+
+    SupportsInsert = False
+
+    def _MustRecreate(self, shown, node):
+        return shown.container != bool(node.children)
+
+
+def shape(node):
+    return (str(node), [shape(c) for c in node.children])
+
+
+def shown_shape(itm):
+    return (itm.label, [shown_shape(c) for c in itm.children])
+
+
+class TestIncreasingRun(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(_increasing_run([]), set())
+
+    def test_sorted(self):
+        self.assertEqual(_increasing_run([0, 1, 2, 3]), {0, 1, 2, 3})
+
+    def test_one_moved_to_front(self):
+        self.assertEqual(_increasing_run([3, 0, 1, 2]), {0, 1, 2})
+
+    def test_one_moved_to_back(self):
+        self.assertEqual(_increasing_run([1, 2, 3, 0]), {1, 2, 3})
+
+    def test_reversed(self):
+        self.assertEqual(len(_increasing_run([3, 2, 1, 0])), 1)
+
+
+class TestSync(unittest.TestCase):
+    ctrl_class = FakeTreeCTRL
+
+    def setUp(self):
+        self.ctrl = self.ctrl_class()
+        self.tree = Tree()
+        self.tree.add(Location.CHILD, "TP")
+        for label in ("DP", "T'", "VP", "PP", "AP"):
+            self.tree.add(Location.CHILD, label)
+            self.tree.selection = self.tree.root
+        self.render()
+
+    def render(self, changed=None):
+        "Syncs the control the way Editor.RenderTree does, and returns the changes it made."
+        self.ctrl.calls.clear()
+        with self.ctrl:
+            self.ctrl.Sync(self.tree.root, Everything(), self.tree.selection, changed)
+        if self.tree.root is None:
+            self.assertIsNone(self.ctrl.top)
+        else:
+            self.assertEqual(shown_shape(self.ctrl.top), shape(self.tree.root))
+        return self.ctrl.calls
+
+    def select(self, label):
+        self.tree.selection = next(
+            c for c in self.tree.root.children if c.label == label
+        )
+
+    def test_initial(self):
+        self.assertEqual(
+            self.ctrl.calls,
+            [("DeleteAll",), ("AddRoot", "TP")]
+            + [("Append", label) for label in ("DP", "T'", "VP", "PP", "AP")],
+        )
+
+    def test_add_child(self):
+        self.select("VP")
+        self.tree.add(Location.CHILD, "V")
+        calls = self.render(changed=self.tree.selection.parent)
+        self.assertIn(("Append", "V"), calls)
+        self.assertNotIn(("AddRoot", "TP"), calls)
+
+    def test_add_sibling(self):
+        self.select("DP")
+        self.tree.add(Location.SIBLING, "NP")
+        calls = self.render(changed=self.tree.selection.parent)
+        self.assertEqual(calls, [("Append", "NP")])
+
+    def test_add_parent(self):
+        self.select("VP")
+        self.tree.add(Location.PARENT, "V'")
+        calls = self.render(changed=self.tree.selection.parent)
+        self.assertNotIn(("AddRoot", "TP"), calls)
+        self.assertIn(("Delete", "VP"), calls)
+
+    def test_add_parent_of_root(self):
+        self.tree.add(Location.PARENT, "CP")
+        calls = self.render(changed=self.tree.selection.parent)
+        self.assertEqual(calls[:2], [("DeleteAll",), ("AddRoot", "CP")])
+
+    def test_delete(self):
+        self.select("VP")
+        self.tree.delete()
+        calls = self.render(changed=self.tree.selection)
+        self.assertEqual(calls, [("Delete", "VP")])
+
+    def test_delete_root(self):
+        self.tree.selection = self.tree.root
+        self.tree.delete()
+        calls = self.render(changed=self.tree.selection)
+        self.assertEqual(calls, [("DeleteAll",)])
+
+    def test_edit(self):
+        self.select("VP")
+        self.tree.edit(label="vP")
+        calls = self.render(changed=self.tree.selection)
+        self.assertEqual(calls, [("SetItemText", "vP")])
+
+    def test_changed_not_shown(self):
+        self.select("VP")
+        self.tree.edit(label="vP")
+        calls = self.render(changed=Node(label="stray"))
+        self.assertEqual(calls, [("SetItemText", "vP")])
+
+    def test_move_up(self):
+        self.select("PP")
+        self.tree.move_up()
+        calls = self.render(changed=self.tree.selection.parent)
+        self.assertEqual([c[0] for c in calls], ["Delete", "Insert"])
+
+    def test_move_down(self):
+        self.select("DP")
+        self.tree.move_down()
+        calls = self.render(changed=self.tree.selection.parent)
+        self.assertEqual([c[0] for c in calls], ["Delete", "Insert"])
+
+    def test_move_by(self):
+        self.select("AP")
+        self.tree.move_by(-4)
+        calls = self.render(changed=self.tree.selection.parent)
+        self.assertEqual(calls, [("Delete", "AP"), ("Insert", "AP")])
+
+    def test_move_subtree(self):
+        self.select("VP")
+        self.tree.add(Location.CHILD, "V")
+        self.render(changed=self.tree.selection.parent)
+        self.select("VP")
+        self.tree.move_up()
+        calls = self.render(changed=self.tree.selection.parent)
+        self.assertNotIn(("AddRoot", "TP"), calls)
+
+
+class TestAppendOnlySync(TestSync):
+    ctrl_class = FakeAppendTreeCTRL
+
+    def test_move_up(self):
+        self.select("PP")
+        self.tree.move_up()
+        calls = self.render(changed=self.tree.selection.parent)
+        # Everything after the first difference is added again.
+        self.assertEqual(
+            calls,
+            [
+                ("Delete", "VP"),
+                ("Delete", "PP"),
+                ("Delete", "AP"),
+                ("Append", "PP"),
+                ("Append", "VP"),
+                ("Append", "AP"),
+            ],
+        )
+
+    def test_move_down(self):
+        self.select("AP")
+        self.tree.move_down()  # Clamped, so nothing changes
+        self.assertEqual(self.render(changed=self.tree.selection.parent), [])
+
+    def test_move_by(self):
+        self.select("DP")
+        self.tree.move_by(4)
+        calls = self.render(changed=self.tree.selection.parent)
+        labels = ["T'", "VP", "PP", "AP", "DP"]
+        self.assertEqual(
+            calls,
+            [("Delete", "DP")]
+            + [("Delete", label) for label in labels[:-1]]
+            + [("Append", label) for label in labels],
+        )
+
+    def test_leaf_gains_children(self):
+        self.select("VP")
+        self.tree.add(Location.CHILD, "V")
+        calls = self.render(changed=self.tree.selection.parent)
+        # A leaf can't become a container, so its item is added again from its parent.
+        self.assertIn(("Delete", "VP"), calls)
+        self.assertIn(("Append", "V"), calls)
+
+    def test_container_loses_children(self):
+        self.select("VP")
+        self.tree.add(Location.CHILD, "V")
+        self.render(changed=self.tree.selection.parent)
+        self.tree.delete()
+        calls = self.render(changed=self.tree.selection)
+        self.assertIn(("Delete", "VP"), calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,139 +11,193 @@ __version__ = "1.0.1"
 
 import gettext
 import html
-import io
 import json
 import os
-import zipfile
+import re
 
 from collections import deque
 from enum import Enum, auto
-from html.parser import HTMLParser
+from functools import lru_cache
 from tempfile import mktemp
-from typing import Optional, Set
-
-_ = gettext.translation("treemendous", fallback=True).gettext
+from typing import Dict, List, Optional, Set, Tuple
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
 
-class GVParser(HTMLParser):
-    TEX_MAP = {
-        "b": "\\textbf{",
-        "i": "\\textit{",
-        "u": "\\underline{",
-        "sup": "^{",
-        "sub": "_{",
-        "null": "{\O",
-        "bar": "^{\prime",
-    }
-    MATHMODE_REQUIRED = ("sup", "sub", "null", "bar")
-    SPECIALS = ("null", "bar")
-
-    def reset(self, *args, **kwargs):
-        self.valid = True
-        self._tag_stack = deque()
-        self._math_stack = deque()
-        self.tex = ""
-        self.data = ""
-        return super().reset(*args, **kwargs)
-
-    def close(self, *args, **kwargs):
-        if self._tag_stack:  # If we have unclosed tags
-            self.valid = False
-        return super().close(*args, **kwargs)
-
-    def handle_starttag(self, tag, attrs):
-        if attrs:
-            self.valid = False
-        if tag not in GVParser.TEX_MAP:
-            self.valid = False
-            self.tex += f"<{tag}>"
-        else:
-            self._tag_stack.append(tag)
-            if tag in GVParser.MATHMODE_REQUIRED:
-                if not self._math_stack:
-                    self.tex += "$"
-                self._math_stack.append(tag)
-            self.tex += GVParser.TEX_MAP[tag]
-        if (
-            tag in GVParser.SPECIALS
-        ):  # some tags should be part of data (for node IDs, etc)
-            self.data += tag.capitalize()
-
-    def handle_endtag(self, tag):
-        try:
-            self.valid = self._tag_stack.pop() in GVParser.TEX_MAP
-        except IndexError:
-            self.valid = False
-        if tag in GVParser.TEX_MAP:
-            self.tex += "}"
-        else:
-            self.tex += f"</{tag}>"
-        if tag in GVParser.MATHMODE_REQUIRED:
-            self._math_stack.pop()
-            if not self._math_stack:
-                self.tex += "$"
+_ = gettext.translation("treemendous", fallback=True).gettext
 
-    def handle_data(self, data):
-        self.tex += data
-        self.data += data
+# Translators: Placeholder text for a node without label.
+UNLABELLED = _("UNLABELLED")
+
+
+def _dump_json(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _load_json(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+TEX_MAP = {
+    "b": "\\textbf{",
+    "i": "\\textit{",
+    "u": "\\underline{",
+    "sup": "^{",
+    "sub": "_{",
+    "null": "{\O",
+    "bar": "^{\prime",
+}
+MATHMODE_REQUIRED = frozenset(("sup", "sub", "null", "bar"))
+SPECIALS = frozenset(("null", "bar"))
+
+# Matches a start, end, or self-closing tag, a run of text, or a stray "<".
+_TOKEN = re.compile(r"<(/?)([A-Za-z][^\s/>]*)\s*(/?)>|([^<]+)|<")
+
+# Graphviz has no equivalent for these tags, so they are replaced before rendering.
+GV_REPLACEMENTS = {"null": "Ø", "bar": "<sup>′</sup>"}
+_GV_REPL_RE = re.compile(
+    r"<(" + "|".join(map(re.escape, GV_REPLACEMENTS)) + r")\s*/>", re.IGNORECASE
+)
+
+
+def _gv_parse(text: str) -> Tuple[str, str, bool]:
+    "Parses HTML-like node text, returning its TeX rendering, plain data, and whether the markup was valid."
+    if "<" not in text and "&" not in text:  # Most labels contain no markup at all
+        return text, text, True
+    return _parse_markup(text)
+
+
+@lru_cache(maxsize=4096)
+def _parse_markup(text: str) -> Tuple[str, str, bool]:
+    # Results are cached, since labels repeat heavily across a tree.
+    valid = True
+    tag_stack = []
+    math_depth = 0
+    tex = []
+    data = []
+    for closing, tag, self_closing, chars in _TOKEN.findall(text):
+        if not tag:
+            if not chars:  # A "<" that doesn't open a tag
+                valid = False
+                chars = "<"
+            chars = html.unescape(chars)
+            tex.append(chars)
+            data.append(chars)
+            continue
+        tag = tag.lower()
+        tex_start = TEX_MAP.get(tag)
+        if tex_start is None:
+            valid = False
+            tex.append(f"<{closing}{tag}{self_closing}>")
+            continue
+        if not closing:
+            tag_stack.append(tag)
+            if tag in MATHMODE_REQUIRED:
+                if not math_depth:
+                    tex.append("$")
+                math_depth += 1
+            tex.append(tex_start)
+            if tag in SPECIALS:  # some tags should be part of data (for node IDs, etc)
+                data.append(tag.capitalize())
+        if closing or self_closing:
+            if not tag_stack or tag_stack.pop() != tag:
+                valid = False
+                continue
+            tex.append("}")
+            if tag in MATHMODE_REQUIRED:
+                math_depth -= 1
+                if not math_depth:
+                    tex.append("$")
+    if tag_stack:  # If we have unclosed tags
+        valid = False
+    return "".join(tex), "".join(data), valid
 
 
 class Node:
-    def __init__(self, label: str = None, value: str = None):
-        self.label = label
-        self.value = value
-        self.children = []
-        self.parent = None
+    __slots__ = ("label", "value", "children", "parent", "_index")
+
+    def __init__(self, label: Optional[str] = None, value: Optional[str] = None):
+        self.label: Optional[str] = label
+        self.value: Optional[str] = value
+        self.children: List["Node"] = []
+        self.parent: Optional["Node"] = None
+        # Position in parent.children, kept in sync by the methods below
+        self._index: int = 0
 
     @classmethod
     def from_dict(cls, data: dict) -> "Node":
         res = cls(label=data.get("label"), value=data.get("value"))
-        for c in data.get("children", []):
-            res.add_child(cls.from_dict(c))
+        stack = deque((res, c) for c in data.get("children", ()))
+        while stack:
+            parent, d = stack.popleft()
+            # Data comes from our own serializer, so skip add_child's checks.
+            node = cls(label=d.get("label"), value=d.get("value"))
+            node.parent = parent
+            node._index = len(parent.children)
+            parent.children.append(node)
+            stack.extend((node, c) for c in d.get("children", ()))
         return res
 
     def __repr__(self) -> str:
-        # Translators: Placeholder text for a node without label.
-        res = _("UNLABELLED")
+        res = UNLABELLED
         if self.label:
             res = self.label
         if self.value:
             res += ": " + self.value
         return res
 
+    def copy(self) -> "Node":
+        "Returns a detached deep copy of this subtree."
+        res = Node(label=self.label, value=self.value)
+        stack = deque((res, c) for c in self.children)
+        while stack:
+            parent, src = stack.popleft()
+            node = Node(label=src.label, value=src.value)
+            node.parent = parent
+            node._index = len(parent.children)
+            parent.children.append(node)
+            stack.extend((node, c) for c in src.children)
+        return res
+
     def to_dict(self) -> dict:
-        return {
-            "label": self.label,
-            "value": self.value,
-            "children": [c.to_dict() for c in self.children],
-        }
+        res = {"label": self.label, "value": self.value, "children": []}
+        stack = deque((res["children"], c) for c in self.children)
+        while stack:
+            children, node = stack.popleft()
+            d = {"label": node.label, "value": node.value, "children": []}
+            children.append(d)
+            stack.extend((d["children"], c) for c in node.children)
+        return res
 
     def to_qtree(self) -> str:
-        def _qtree(node: Node, parser: HTMLParser, level: int = 0) -> str:
-            parser.reset()
-            parser.feed(node.label)
-            parser.close()
-            lbl = parser.tex if parser.valid else node.label
+        def _qtree(node: Node, out: List[str], level: int = 0) -> None:
+            tex, _data, valid = _gv_parse(node.label)
+            lbl = tex if valid else node.label
             if node.value:
-                parser.reset()
-                parser.feed(node.value)
-                parser.close()
-                val = parser.tex if parser.valid else node.value
+                tex, _data, valid = _gv_parse(node.value)
+                val = tex if valid else node.value
             else:
                 val = None
             leaf = not node.children and level > 0
-            res = "  " * level + f"{'[.' if not leaf else ''}{lbl}"
+            indent = "  " * level
+            out.append(f"{indent}{'[.' if not leaf else ''}{lbl}")
             if val:
-                res += f"\\\\{val}"
-            res += "\n"
+                out.append(f"\\\\{val}")
+            out.append("\n")
             for c in node.children:
-                res += _qtree(c, parser, level + 1)
+                _qtree(c, out, level + 1)
             if not leaf:
-                res += "  " * level + "]\n"
-            return res
+                out.append(f"{indent}]\n")
 
-        parser = GVParser()
-        return "\\Tree " + _qtree(self, parser)
+        out = ["\\Tree "]
+        _qtree(self, out)
+        return "".join(out)
 
     def to_graphviz(
         self,
@@ -151,55 +205,55 @@ class Node:
         graph: Optional["graphviz.Graph"] = None,
         name_set: Optional[Set[str]] = None,
     ) -> "graphviz.Graph":
-        def _fresh_name(name: str, names: Set[str]):
+        def _fresh_name(name: str, names: Dict[str, int]):
+            # names maps every name handed out so far to the last numeric suffix tried for it,
+            # so repeated labels resume probing where they left off instead of starting at 2.
             if name == "":  # Some nodes in angle brackets have a blank ID
                 name = "node"
-            res = name
-            num = 1
-            while res in names:
+            num = names.get(name)
+            if num is None:
+                names[name] = 1
+                return name
+            while True:
                 num += 1
                 res = f"{name}{num}"
-            names.add(res)
+                if res not in names:
+                    break
+            names[name] = num
+            names[res] = 1
             return res
 
-        def _is_valid(text: str, parser: HTMLParser) -> bool:
-            parser.reset()
-            parser.feed(text)
-            parser.close()
-            return parser.valid
-
-        def _escape_if_needed(text: str, parser: HTMLParser) -> str:
-            cleaned_text = text
-            REPLACEMENTS = {"<null/>": "Ø", "<bar/>": "<sup>′</sup>"}
-            for src, dest in REPLACEMENTS.items():
-                cleaned_text = cleaned_text.replace(src, dest)
-            valid = _is_valid(text, parser)
-            if valid:
-                return cleaned_text
-            else:
-                return html.escape(text)
-
-        def _add_node(
-            node: Node,
-            graph: "graphviz.Graph",
-            name_set: Set[str],
-            parser: HTMLParser,
-            parent: Node = None,
-        ) -> None:
-            parser.reset()
-            parser.feed(node.label)
-            id = _fresh_name(parser.data, name_set)
-            if node.value:
-                label = f"<{_escape_if_needed(node.label, parser)}<br/>{_escape_if_needed(node.value, parser)}>"
-            else:
-                label = _escape_if_needed(node.label, parser)
-                if _is_valid(label, parser):
-                    label = "<" + label + ">"
-            graph.node(id, label)
-            if parent:
-                graph.edge(parent, id)
-            for c in node.children:
-                _add_node(c, graph, name_set, parser, parent=id)
+        def _process(text: str) -> Tuple[str, str]:
+            "Returns the plain data (for IDs) and Graphviz HTML label markup for text, escaping it if its markup is invalid."
+            _tex, data, valid = _gv_parse(text)
+            if not valid:
+                return data, html.escape(text)
+            if "<" not in text:  # Nothing to replace
+                return data, text
+            return data, _GV_REPL_RE.sub(
+                lambda m: GV_REPLACEMENTS[m.group(1).lower()], text
+            )
+
+        def _quote(id: str) -> str:
+            return '"' + id.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+        def _add_nodes(root: Node, body: List[str], names: Dict[str, int]) -> None:
+            # Emits DOT statements directly, as calling graph.node/graph.edge per node is comparatively slow.
+            # Pre-order walk, so that fresh names are handed out top-down, left to right.
+            stack = deque([(root, None)])
+            while stack:
+                node, parent = stack.pop()
+                data, label = _process(node.label)
+                id = _quote(_fresh_name(data, names))
+                # Escaped or cleaned markup is always valid, so it can be used as an HTML-like label.
+                if node.value:
+                    label = f"<{label}<br/>{_process(node.value)[1]}>"
+                else:
+                    label = f"<{label}>"
+                body.append(f"\t{id} [label={label}]\n")
+                if parent:
+                    body.append(f"\t{parent} -- {id}\n")
+                stack.extend((c, id) for c in reversed(node.children))
 
         import graphviz
 
@@ -212,30 +266,41 @@ class Node:
                 "ranksep": "0.02",
             },
         )  # ranksep is height of edges in inches, minimum is 0.02
-        name_set = set()
-        parser = GVParser()
-        _add_node(self, graph, name_set, parser)
+        _add_nodes(self, graph.body, {})
         return graph
 
     def add_child(self, c: "Node") -> None:
         assert c.parent is None
+        c._index = len(self.children)
         self.children.append(c)
         c.parent = self
 
     def delete(self) -> None:
         assert self.parent is not None  # Deleting the root is a special case
-        self.parent.children.remove(self)
+        siblings = self.parent.children
+        del siblings[self._index]
+        for i in range(self._index, len(siblings)):
+            siblings[i]._index = i
 
     def add_parent(self, node: "Node") -> None:
         assert self.parent is not None  # Replacing the root is a special case
         assert node.parent is None
-        i = self.parent.children.index(self)
         node.parent = self.parent
-        del self.parent.children[i]
-        self.parent.children.insert(i, node)
+        node._index = self._index
+        self.parent.children[self._index] = node
         self.parent = None
         node.add_child(self)
 
+    def shift(self, direction: int) -> None:
+        "Moves this node direction places among its siblings, clamped to the ends of the list."
+        assert self.parent is not None  # The root has no siblings
+        siblings = self.parent.children
+        old = self._index
+        new = min(max(old + direction, 0), len(siblings) - 1)
+        siblings.insert(new, siblings.pop(old))
+        for i in range(min(old, new), max(old, new) + 1):
+            siblings[i]._index = i
+
 
 class Location(Enum):
     CHILD = auto()
@@ -262,7 +327,16 @@ class IncompatibleFormatError(TreemendousError):
 DEFAULT_MANIFEST: dict = {"version": __version__}
 
 
-_pasteboard: dict = None
+_pasteboard: Node = None
+
+
+def render_graphviz(graph: "graphviz.Graph", path: str = None) -> str:
+    "Renders graph as a .png image at path (a temporary file by default) and returns the path of the image. This only runs Graphviz, so it is safe to call off the main thread once the graph is built."
+    if path is None:
+        path = mktemp(prefix="treemendous")
+    else:
+        path = os.path.splitext(path)[0]
+    return graph.render(path, cleanup=True)
 
 
 class Tree:
@@ -271,12 +345,18 @@ class Tree:
         self.last_path: str = path or ""
         self.selection: Node = None
         self.manifest: dict = DEFAULT_MANIFEST.copy()
+        # Serialized manifest, reused across saves. Reset to None whenever the manifest changes.
+        self._manifest_json: Optional[bytes] = None
+        # Rendered qtree markup, reused until the nodes are changed through this tree's methods. Reset to None on every such change.
+        self._qtree: Optional[str] = None
 
         if path:
+            import zipfile
+
             try:
                 with zipfile.ZipFile(path) as zip:
                     with zip.open("manifest.json") as fin:
-                        m = json.load(fin)
+                        m = _load_json(fin.read())
                         self.manifest.update(m)
                         my_major = int(__version__.split(".")[0])
                         their_major = int(self.manifest["version"].split(".")[0])
@@ -291,7 +371,7 @@ class Tree:
                                 )
                             )
                     with zip.open("tree.json") as fin:
-                        d = json.load(fin)
+                        d = _load_json(fin.read())
                         self.root: Node = Node.from_dict(d)
             except (KeyError, zipfile.BadZipFile):
                 raise IncompatibleFormatError(
@@ -314,6 +394,7 @@ class Tree:
     @notes.setter
     def notes(self, new: str):
         self.manifest["notes"] = new
+        self._manifest_json = None
         self.dirty = True
 
     def save(self, path: str = None) -> None:
@@ -324,17 +405,18 @@ class Tree:
             else:
                 raise SaveError("No last path")
         if path.endswith(".gv"):
-            g = self.root.to_graphviz()
-            if self.last_path:
-                g.name = os.path.splitext(os.path.basename(self.last_path))[0]
-            return g.save(path)
+            return self.to_graphviz().save(path)
         if path.endswith(".png"):
             return self.graphviz(path)
-        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_LZMA) as zip:
-            with zip.open("tree.json", "w") as cam:
-                json.dump(self.root.to_dict(), io.TextIOWrapper(cam), indent=2)
-            with zip.open("manifest.json", "w") as cam:
-                json.dump(self.manifest, io.TextIOWrapper(cam), indent=2)
+        import zipfile
+
+        with zipfile.ZipFile(
+            path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6
+        ) as zip:
+            zip.writestr("tree.json", _dump_json(self.root.to_dict()))
+            if self._manifest_json is None:
+                self._manifest_json = _dump_json(self.manifest)
+            zip.writestr("manifest.json", self._manifest_json)
         self.dirty = False
         self.last_path = path
 
@@ -342,18 +424,20 @@ class Tree:
         "Renders this tree as LaTeX (dependant on qtree) markup."
         # Translators: The comment added at the top of a LaTeX document. The \usepackage{qtree} is LaTeX code that should not be translated.
         COMMENT = _("Add \\usepackage{qtree} to the preamble of your document.")
-        return f"% {COMMENT}\n\n{self.root.to_qtree()}"
+        if self._qtree is None:
+            self._qtree = f"% {COMMENT}\n\n{self.root.to_qtree()}"
+        return self._qtree
 
-    def graphviz(self, path: str = None, dpi: Optional[int] = None) -> None:
-        "Renders this tree as a .png image using Graphviz."
+    def to_graphviz(self, dpi: Optional[int] = None) -> "graphviz.Graph":
+        "Converts this tree to a Graphviz graph, named after the file it was last saved to."
         g = self.root.to_graphviz(dpi=dpi)
-        if path is None:
-            path = mktemp(prefix="treemendous")
-        else:
-            path = os.path.splitext(path)[0]
         if self.last_path:
             g.name = os.path.splitext(os.path.basename(self.last_path))[0]
-        return g.render(path, cleanup=True)
+        return g
+
+    def graphviz(self, path: str = None, dpi: Optional[int] = None) -> str:
+        "Renders this tree as a .png image using Graphviz."
+        return render_graphviz(self.to_graphviz(dpi=dpi), path)
 
     def _add(self, where: Location, new: Node) -> None:
         assert isinstance(where, Location)
@@ -374,6 +458,7 @@ class Tree:
                 raise TreemendousError("The root cannot have siblings!")
             self.selection.parent.add_child(new)
         self.selection = new
+        self._qtree = None
         self.dirty = True
 
     def add(self, where: Location, label: str = None, value: str = None) -> None:
@@ -401,6 +486,7 @@ class Tree:
             else:
                 self.selection.value = value
                 self.dirty = True
+        self._qtree = None
 
     def delete(self) -> None:
         "Deletes the currently selected node and all descendants."
@@ -412,6 +498,7 @@ class Tree:
         else:
             self.selection = n.parent
             n.delete()
+        self._qtree = None
         self.dirty = True
 
     def copy(self) -> None:
@@ -419,31 +506,30 @@ class Tree:
         if self.selection is None:
             raise SelectionError("No selection!")
         global _pasteboard
-        _pasteboard = self.selection.to_dict()
+        _pasteboard = self.selection.copy()
 
     def paste(self, where: Location) -> None:
         "Pastes the contents of the (Treemendous internal) pasteboard to the location specified as a member of the Location enumeration in this module."
         global _pasteboard
-        if not _pasteboard:
+        if _pasteboard is None:
             raise SelectionError("Pasteboard is empty!")
-        new = Node.from_dict(_pasteboard)
+        new = _pasteboard.copy()
         self._add(where=where, new=new)
 
-    def _shift(self, direction: int) -> None:
+    def move_by(self, direction: int) -> None:
+        "Moves the currently selected node direction places among its siblings (negative is up), stopping at the first or last position."
         if not self.selection:
             raise SelectionError("No selection!")
         elif self.selection == self.root:
             raise TreemendousError("Cannot shift the root!")
-        t = self.selection.parent.children
-        old = t.index(self.selection)
-        new = old + direction
-        t.insert(new, t.pop(old))
+        self.selection.shift(direction)
+        self._qtree = None
         self.dirty = True
 
     def move_up(self) -> None:
         "Moves the currently selected node up relative to its siblings."
-        return self._shift(-1)
+        return self.move_by(-1)
 
     def move_down(self) -> None:
         "Moves the currently selected node down relative to its siblings."
-        return self._shift(1)
+        return self.move_by(1)
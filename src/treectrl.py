@@ -10,10 +10,11 @@ import wx
 import wx.dataview
 
 from abc import ABC, abstractmethod
-from enum import auto, Enum
+from bisect import bisect_left
+from enum import auto, IntEnum
 
 
-class TreeEvent(Enum):
+class TreeEvent(IntEnum):
     ITEM_SELECTED = auto()
     ITEM_EXPANDED = auto()
     ITEM_COLLAPSED = auto()
@@ -21,9 +22,103 @@ class TreeEvent(Enum):
     KEY_DOWN = auto()
 
 
+class _ShownNode:
+    "What the control currently shows for a node, so that Sync can tell what changed since the last call."
+
+    __slots__ = ("item", "text", "parent", "children", "container", "loaded")
+
+    def __init__(self, item, node, text):
+        self.item = item
+        self.text = text
+        self.parent = node.parent
+        self.children = []
+        self.container = bool(node.children)
+        # Children are only added once the node is first expanded (or has to be revealed).
+        self.loaded = False
+
+
+def _increasing_run(values):
+    "Returns the set of values in a longest increasing subsequence of values."
+    # tails[k] is the smallest last value of an increasing run of length k + 1, at index ends[k].
+    tails = []
+    ends = []
+    previous = [None] * len(values)
+    for i, value in enumerate(values):
+        k = bisect_left(tails, value)
+        if k:
+            previous[i] = ends[k - 1]
+        if k == len(tails):
+            tails.append(value)
+            ends.append(i)
+        else:
+            tails[k] = value
+            ends[k] = i
+    run = set()
+    i = ends[-1] if ends else None
+    while i is not None:
+        run.add(values[i])
+        i = previous[i]
+    return run
+
+
 class TreeCTRL(ABC):
     "Base tree control interface."
 
+    # Whether InsertChildren can add items in the middle of a parent's children.
+    SupportsInsert = False
+
+    __slots__ = (
+        "_nodes",
+        "_shown",
+        "_root",
+        "_expanded",
+        "_batch_depth",
+        "_pending_selection",
+    )
+
+    def __init__(self):
+        self._nodes = {}
+        self._shown = {}
+        self._root = None
+        self._expanded = ()
+        self._batch_depth = 0
+        self._pending_selection = None
+
+    def __enter__(self):
+        "Freezes the control so that a batch of changes is painted once, when the with block exits."
+        self._batch_depth += 1
+        self.widget.Freeze()
+        return self
+
+    def __exit__(self, *exc):
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self._EndBatch()
+        self.widget.Thaw()
+
+    def _EndBatch(self):
+        "Called when the outermost with block exits."
+        if self._pending_selection is not None:
+            handler, event = self._pending_selection
+            self._pending_selection = None
+            # The item may have been deleted later in the batch.
+            if self._HasItem(event.GetItem()):
+                handler(event)
+
+    def _HasItem(self, itm):
+        return int(itm.GetID()) in self._nodes
+
+    def _CoalesceSelection(self, handler):
+        "Wraps a selection handler so that selection changes during a batch are handled once, when it ends."
+
+        def wrapper(event):
+            if self._batch_depth:
+                self._pending_selection = (handler, event.Clone())
+            else:
+                handler(event)
+
+        return wrapper
+
     @property
     @abstractmethod
     def widget(self):
@@ -37,8 +132,18 @@ class TreeCTRL(ABC):
     def AddChild(self, node, expanded):
         raise NotImplementedError
 
+    def AddChildren(self, rootitm, nodes, expanded, labels=None):
+        "Appends nodes under rootitm in order, expanding those in the expanded collection. Returns the new items."
+        # labels, if given, are the already computed str() of each node.
+        return [self.AddChild(rootitm, node, node in expanded) for node in nodes]
+
+    def InsertChildren(self, rootitm, pos, nodes, expanded, labels=None):
+        "Like AddChildren, but inserts the nodes before the child at pos. Only used if SupportsInsert is set."
+        raise NotImplementedError
+
     @abstractmethod
     def BindEvent(self, evt, handler):
+        "Binds handler to evt on the native widget itself, so tree events never go through the frame's handlers."
         raise NotImplementedError
 
     @abstractmethod
@@ -46,66 +151,324 @@ class TreeCTRL(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def CollapseChildren(self, itm):
+    def DeleteItem(self, itm):
         raise NotImplementedError
 
     @abstractmethod
-    def GetNodeFromItem(self, itm):
+    def SetItemText(self, itm, text):
         raise NotImplementedError
 
+    @abstractmethod
+    def CollapseChildren(self, itm):
+        raise NotImplementedError
+
+    def _MustRecreate(self, shown, node):
+        "Returns True if the item for node can't show its current children and has to be added again."
+        return False
+
+    def _UpdateContainer(self, shown, node):
+        "Makes the item for node show whether it can be expanded, even if its children haven't been added yet."
+        shown.container = bool(node.children)
+
+    def Sync(self, root, expanded, reveal=None, changed=None):
+        "Updates the control to show the tree under root, only touching the items of nodes that changed."
+        # Collapsed branches are filled in when they are first expanded, except for those leading to reveal.
+        # If the caller knows that only the subtree under changed was modified, only that subtree is compared.
+        self._expanded = expanded
+        if root is not self._root:
+            self.DeleteAll()
+            if root is None:
+                return
+            self._root = root
+            itm = self.AddRoot(root, root in expanded)
+            self._shown[root] = _ShownNode(itm, root, str(root))
+        path = set()
+        while reveal is not None:
+            reveal = reveal.parent
+            path.add(reveal)
+        if changed not in self._shown:
+            changed = root
+        elif changed is not root and self._MustRecreate(self._shown[changed], changed):
+            changed = changed.parent  # Its item is replaced from its parent
+        self._SyncSubtree(changed, expanded, path)
+
+    def _OnExpanding(self, event):
+        event.Skip()
+        node = self.GetNodeFromItem(event.GetItem())
+        shown = self._shown.get(node)
+        if shown is not None and not shown.loaded:
+            shown.loaded = True
+            with self:
+                self._SyncSubtree(node, self._expanded, ())
+
+    def _SyncSubtree(self, node, expanded, path):
+        # Walk with an explicit stack, since trees can be deeper than the recursion limit.
+        stack = [node]
+        while stack:
+            stack.extend(reversed(self._SyncNode(stack.pop(), expanded, path)))
+
+    def _SyncNode(self, node, expanded, path):
+        "Brings the item for node up to date, and returns the children that need syncing in turn."
+        shown = self._shown[node]
+        text = str(node)
+        if shown.text != text:
+            self.SetItemText(shown.item, text)
+            shown.text = text
+        if shown.container != bool(node.children):
+            self._UpdateContainer(shown, node)
+        if not shown.loaded:
+            if node not in expanded and node not in path:
+                return ()
+            shown.loaded = True
+        stale = {
+            child
+            for child in node.children
+            if child in self._shown and self._MustRecreate(self._shown[child], child)
+        }
+        if stale or shown.children != node.children:
+            index = {child: i for i, child in enumerate(node.children)}
+            for child in shown.children:
+                if child not in index:
+                    self._RemoveChild(node, child)
+            kept = [index[c] for c in shown.children if c in index and c not in stale]
+            if self.SupportsInsert:
+                # Keep the largest set of items that are already in order, and move the others around them.
+                placed = _increasing_run(kept)
+            else:
+                # Items can only be appended, so everything after the first difference is added again.
+                prefix = 0
+                while prefix < len(kept) and kept[prefix] == prefix:
+                    prefix += 1
+                placed = set(range(prefix))
+            for i in kept:
+                if i not in placed:
+                    self._RemoveChild(node, node.children[i])
+            start = 0
+            while start < len(node.children):
+                if start in placed:
+                    start += 1
+                    continue
+                end = start
+                while end < len(node.children) and end not in placed:
+                    end += 1
+                self._AddRun(node, start, node.children[start:end], expanded)
+                start = end
+            shown.children = list(node.children)
+        return node.children
+
+    def _AddRun(self, parent, pos, nodes, expanded):
+        for child in nodes:
+            # A node moved here from a parent that hasn't been synced yet still has its old item.
+            if child in self._shown:
+                self._RemoveChild(self._shown[child].parent, child)
+        labels = [str(child) for child in nodes]
+        rootitm = self._shown[parent].item
+        if pos + len(nodes) == len(parent.children):
+            items = self.AddChildren(rootitm, nodes, expanded, labels)
+        else:
+            items = self.InsertChildren(rootitm, pos, nodes, expanded, labels)
+        for child, itm, label in zip(nodes, items, labels):
+            self._shown[child] = _ShownNode(itm, child, label)
+
+    def _RemoveChild(self, parent, node):
+        shown = self._shown.get(node)
+        if shown is None or shown.parent is not parent:
+            return  # Already removed, or shown somewhere else since
+        self.DeleteItem(shown.item)
+        self._Forget(node)
+
+    def _Forget(self, node):
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            shown = self._shown.pop(node)
+            self._nodes.pop(int(shown.item.GetID()), None)
+            for child in shown.children:
+                descendant = self._shown.get(child)
+                if descendant is not None and descendant.parent is node:
+                    stack.append(child)
+
+    def GetItemFromNode(self, node):
+        "Returns the item showing node, or None if it isn't shown."
+        shown = self._shown.get(node)
+        return shown.item if shown is not None else None
+
+    def _RememberNode(self, itm, node):
+        # Subclasses keep a map of item IDs to nodes, so that looking up the node behind an event doesn't
+        # need a round trip through the native control. It must be cleared whenever items are deleted.
+        self._nodes[int(itm.GetID())] = node
+        return itm
+
+    def GetNodeFromItem(self, itm):
+        node = self._nodes.get(int(itm.GetID()))
+        if node is None:
+            node = self.widget.GetItemData(itm)
+        return node
+
     @abstractmethod
     def Select(self, itm):
         raise NotImplementedError
 
 
 class WinTreeCTRL(TreeCTRL):
+    TreeEventsToWXEvents = {
+        TreeEvent.ITEM_SELECTED: wx.EVT_TREE_SEL_CHANGED,
+        TreeEvent.ITEM_EXPANDED: wx.EVT_TREE_ITEM_EXPANDED,
+        TreeEvent.ITEM_COLLAPSED: wx.EVT_TREE_ITEM_COLLAPSED,
+        TreeEvent.CONTEXT_MENU: wx.EVT_TREE_ITEM_MENU,
+        TreeEvent.KEY_DOWN: wx.EVT_KEY_DOWN,
+    }
+
+    SupportsInsert = True
+
+    __slots__ = ("_inner", "_pending_expands", "_restoring")
+
     def __init__(self, *args, **kwargs):
+        super().__init__()
         self._inner = wx.TreeCtrl(*args, **kwargs)
+        self._inner.Bind(wx.EVT_TREE_ITEM_EXPANDING, self._OnExpanding)
+        self._pending_expands = []
+        self._restoring = False
+
+    def _EndBatch(self):
+        # Items can only be expanded once their children exist, so expand them all after the batch.
+        # These nodes are already in the expanded collection, so their expand events are not passed on.
+        self._restoring = True
+        try:
+            for itm, node in self._pending_expands:
+                # Skip items deleted later in the batch, along with their whole subtree.
+                if self._nodes.get(int(itm.GetID())) is node:
+                    self._inner.Expand(itm)
+        finally:
+            self._restoring = False
+        self._pending_expands.clear()
+        super()._EndBatch()
+
+    def _IgnoreRestoredExpands(self, handler):
+        def wrapper(event):
+            if not self._restoring:
+                handler(event)
+
+        return wrapper
 
     @property
     def widget(self):
         return self._inner
 
+    def _Expand(self, itm, node):
+        if self._batch_depth:
+            self._pending_expands.append((itm, node))
+        else:
+            self._inner.Expand(itm)
+
     def AddRoot(self, node, expanded):
         itm = self._inner.AddRoot(str(node))
         self._inner.SetItemData(itm, node)
+        self._inner.SetItemHasChildren(itm, bool(node.children))
+        self._RememberNode(itm, node)
         if expanded:
-            self._inner.Expand(itm)
+            self._Expand(itm, node)
         return itm
 
     def AddChild(self, rootitm, node, expanded):
         itm = self._inner.AppendItem(rootitm, str(node))
         self._inner.SetItemData(itm, node)
+        self._inner.SetItemHasChildren(itm, bool(node.children))
+        self._RememberNode(itm, node)
         if expanded:
-            self._inner.Expand(itm)
+            self._Expand(itm, node)
         return itm
 
+    def AddChildren(self, rootitm, nodes, expanded, labels=None):
+        if labels is None:
+            labels = [str(node) for node in nodes]
+        append = self._inner.AppendItem
+        items = []
+        for node, label in zip(nodes, labels):
+            itm = append(rootitm, label, data=node)
+            if node.children:
+                # Show the expand button before the children themselves are added.
+                self._inner.SetItemHasChildren(itm)
+            items.append(self._RememberNode(itm, node))
+            if node in expanded:
+                self._Expand(itm, node)
+        return items
+
+    def InsertChildren(self, rootitm, pos, nodes, expanded, labels=None):
+        if labels is None:
+            labels = [str(node) for node in nodes]
+        insert = self._inner.InsertItem
+        items = []
+        for offset, (node, label) in enumerate(zip(nodes, labels)):
+            itm = insert(rootitm, pos + offset, label, data=node)
+            if node.children:
+                self._inner.SetItemHasChildren(itm)
+            items.append(self._RememberNode(itm, node))
+            if node in expanded:
+                self._Expand(itm, node)
+        return items
+
     def BindEvent(self, evt, handler):
-        TreeEventsToWXEvents = {
-            TreeEvent.ITEM_SELECTED: wx.EVT_TREE_SEL_CHANGED,
-            TreeEvent.ITEM_EXPANDED: wx.EVT_TREE_ITEM_EXPANDED,
-            TreeEvent.ITEM_COLLAPSED: wx.EVT_TREE_ITEM_COLLAPSED,
-            TreeEvent.CONTEXT_MENU: wx.EVT_TREE_ITEM_MENU,
-            TreeEvent.KEY_DOWN: wx.EVT_KEY_DOWN,
-        }
-        return self._inner.Bind(TreeEventsToWXEvents[evt], handler)
+        if evt == TreeEvent.ITEM_SELECTED:
+            handler = self._CoalesceSelection(handler)
+        elif evt == TreeEvent.ITEM_EXPANDED:
+            handler = self._IgnoreRestoredExpands(handler)
+        return self._inner.Bind(self.TreeEventsToWXEvents[evt], handler)
 
     def DeleteAll(self):
+        self._nodes.clear()
+        self._shown.clear()
+        self._root = None
+        self._pending_expands.clear()
         return self._inner.DeleteAllItems()
 
-    def CollapseChildren(self, itm):
-        return self._inner.CollapseAllChildren(itm)
+    def DeleteItem(self, itm):
+        return self._inner.Delete(itm)
 
-    def GetNodeFromItem(self, itm):
-        return self._inner.GetItemData(itm)
+    def SetItemText(self, itm, text):
+        return self._inner.SetItemText(itm, text)
+
+    def _UpdateContainer(self, shown, node):
+        self._inner.SetItemHasChildren(shown.item, bool(node.children))
+        super()._UpdateContainer(shown, node)
+
+    def CollapseChildren(self, itm):
+        # CollapseAllChildren visits every descendant; only expanded ones need collapsing.
+        inner = self._inner
+        expanded = []
+        stack = [itm]
+        while stack:
+            child, cookie = inner.GetFirstChild(stack.pop())
+            while child.IsOk():
+                if inner.IsExpanded(child):
+                    expanded.append(child)
+                    stack.append(child)
+                child = inner.GetNextSibling(child)
+        # Deepest first, so the collapse handlers of the outer items find nothing left to do.
+        for child in reversed(expanded):
+            inner.Collapse(child)
 
     def Select(self, itm):
         return self._inner.SelectItem(itm)
 
 
 class MacTreeCTRL(TreeCTRL):
+    TreeEventsToWXEvents = {
+        TreeEvent.ITEM_SELECTED: wx.dataview.EVT_DATAVIEW_SELECTION_CHANGED,
+        TreeEvent.ITEM_EXPANDED: wx.dataview.EVT_DATAVIEW_ITEM_EXPANDED,
+        TreeEvent.ITEM_COLLAPSED: wx.dataview.EVT_DATAVIEW_ITEM_COLLAPSED,
+        TreeEvent.CONTEXT_MENU: wx.dataview.EVT_DATAVIEW_ITEM_CONTEXT_MENU,
+        TreeEvent.KEY_DOWN: wx.EVT_KEY_DOWN,
+    }
+
+    __slots__ = ("_inner",)
+
+    _NULL = wx.dataview.NullDataViewItem
+
     def __init__(self, *args, **kwargs):
+        super().__init__()
         self._inner = wx.dataview.DataViewTreeCtrl(*args, **kwargs)
+        self._inner.Bind(wx.dataview.EVT_DATAVIEW_ITEM_EXPANDING, self._OnExpanding)
         self._inner.Bind(
             wx.dataview.EVT_DATAVIEW_ITEM_START_EDITING, lambda event: event.Veto()
         )  # block editing
@@ -116,9 +479,9 @@ class MacTreeCTRL(TreeCTRL):
 
     def AddRoot(self, node, expanded):
         itm = self._inner.AppendContainer(
-            wx.dataview.NullDataViewItem, str(node), expanded=expanded, data=node
+            self._NULL, str(node), expanded=expanded, data=node
         )
-        return itm
+        return self._RememberNode(itm, node)
 
     def AddChild(self, rootitm, node, expanded):
         if node.children:
@@ -127,32 +490,190 @@ class MacTreeCTRL(TreeCTRL):
             )
         else:
             itm = self._inner.AppendItem(rootitm, str(node), data=node)
-        return itm
+        return self._RememberNode(itm, node)
+
+    def AddChildren(self, rootitm, nodes, expanded, labels=None):
+        if labels is None:
+            labels = [str(node) for node in nodes]
+        appendContainer = self._inner.AppendContainer
+        appendItem = self._inner.AppendItem
+        items = []
+        for node, label in zip(nodes, labels):
+            if node.children:
+                itm = appendContainer(
+                    rootitm, label, expanded=node in expanded, data=node
+                )
+            else:
+                itm = appendItem(rootitm, label, data=node)
+            items.append(self._RememberNode(itm, node))
+        return items
 
     def BindEvent(self, evt, handler):
-        TreeEventsToWXEvents = {
-            TreeEvent.ITEM_SELECTED: wx.dataview.EVT_DATAVIEW_SELECTION_CHANGED,
-            TreeEvent.ITEM_EXPANDED: wx.dataview.EVT_DATAVIEW_ITEM_EXPANDED,
-            TreeEvent.ITEM_COLLAPSED: wx.dataview.EVT_DATAVIEW_ITEM_COLLAPSED,
-            TreeEvent.CONTEXT_MENU: wx.dataview.EVT_DATAVIEW_ITEM_CONTEXT_MENU,
-            TreeEvent.KEY_DOWN: wx.EVT_KEY_DOWN,
-        }
         if evt == TreeEvent.CONTEXT_MENU:
             # VoiceOver seems not to be able to activate the context menu (VO+shift+m does nothing).
             # As a fallback, also bind to item activation.
             self._inner.Bind(wx.dataview.EVT_DATAVIEW_ITEM_ACTIVATED, handler)
-        return self._inner.Bind(TreeEventsToWXEvents[evt], handler)
+        elif evt == TreeEvent.ITEM_SELECTED:
+            handler = self._CoalesceSelection(handler)
+        return self._inner.Bind(self.TreeEventsToWXEvents[evt], handler)
 
     def DeleteAll(self):
+        self._nodes.clear()
+        self._shown.clear()
+        self._root = None
         return self._inner.DeleteAllItems()
 
+    def DeleteItem(self, itm):
+        return self._inner.DeleteItem(itm)
+
+    def SetItemText(self, itm, text):
+        return self._inner.SetItemText(itm, text)
+
+    def _MustRecreate(self, shown, node):
+        # Only containers can have children, and items can't change between the two once added.
+        return shown.container != bool(node.children)
+
     def CollapseChildren(self, itm):
         return self._inner.Collapse(
             itm
         )  # DataViewTreeCtrl seems not to support collapsing children
 
+    def Select(self, itm):
+        return self._inner.Select(itm)
+
+
+class _NodeModel(wx.dataview.PyDataViewModel):
+    "Exposes a tree of nodes to a DataViewCtrl, which only asks for the rows it is showing."
+
+    def __init__(self):
+        super().__init__()
+        self.root = None
+
+    def GetColumnCount(self):
+        return 1
+
+    def GetColumnType(self, col):
+        return "string"
+
+    def GetChildren(self, parent, children):
+        if not parent.IsOk():
+            nodes = (self.root,) if self.root is not None else ()
+        else:
+            nodes = self.ItemToObject(parent).children
+        for node in nodes:
+            children.append(self.ObjectToItem(node))
+        return len(nodes)
+
+    def IsContainer(self, item):
+        return not item.IsOk() or bool(self.ItemToObject(item).children)
+
+    def GetParent(self, item):
+        parent = self.ItemToObject(item).parent if item.IsOk() else None
+        if parent is None:
+            return wx.dataview.NullDataViewItem
+        return self.ObjectToItem(parent)
+
+    def GetValue(self, item, col):
+        return str(self.ItemToObject(item))
+
+    def SetValue(self, value, item, col):
+        return False
+
+
+class VirtualTreeCTRL(TreeCTRL):
+    "A DataViewCtrl backed by a model that reads the tree directly, so only visible rows exist natively."
+
+    TreeEventsToWXEvents = MacTreeCTRL.TreeEventsToWXEvents
+
+    __slots__ = ("_inner", "_model")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        kwargs["style"] = kwargs.get("style", 0) | wx.dataview.DV_NO_HEADER
+        self._inner = wx.dataview.DataViewCtrl(*args, **kwargs)
+        self._model = _NodeModel()
+        self._inner.AssociateModel(self._model)
+        self._model.DecRef()  # The control owns the model now
+        # The column is inert, so no editing events are ever fired.
+        self._inner.AppendTextColumn("", 0, mode=wx.dataview.DATAVIEW_CELL_INERT)
+
+    @property
+    def widget(self):
+        return self._inner
+
+    def Sync(self, root, expanded, reveal=None, changed=None):
+        "Refreshes the whole control from the tree under root. changed is ignored, since the model doesn't remember what it last showed."
+        # The model reads the tree itself, so the control only has to be told to refresh what it shows.
+        self._expanded = expanded
+        self._root = self._model.root = root
+        self._model.Cleared()
+        stack = [root] if root is not None else []
+        while stack:
+            node = stack.pop()
+            if node in expanded:
+                self._inner.Expand(self._model.ObjectToItem(node))
+                stack.extend(node.children)
+        if reveal is not None:
+            self._inner.EnsureVisible(self._model.ObjectToItem(reveal))
+
+    def GetItemFromNode(self, node):
+        return self._model.ObjectToItem(node) if self._root is not None else None
+
     def GetNodeFromItem(self, itm):
-        return self._inner.GetItemData(itm)
+        return self._model.ItemToObject(itm)
+
+    def _HasItem(self, itm):
+        node = self._model.ItemToObject(itm)
+        while node.parent is not None:
+            node = node.parent
+        return node is self._root
+
+    def AddRoot(self, node, expanded):
+        self._root = self._model.root = node
+        itm = self._model.ObjectToItem(node)
+        self._model.ItemAdded(wx.dataview.NullDataViewItem, itm)
+        if expanded:
+            self._inner.Expand(itm)
+        return itm
+
+    def AddChild(self, rootitm, node, expanded):
+        itm = self._model.ObjectToItem(node)
+        self._model.ItemAdded(rootitm, itm)
+        if expanded:
+            self._inner.Expand(itm)
+        return itm
+
+    def AddChildren(self, rootitm, nodes, expanded, labels=None):
+        # The model reads labels itself when the rows are shown.
+        items = wx.dataview.DataViewItemArray()
+        for node in nodes:
+            items.append(self._model.ObjectToItem(node))
+        self._model.ItemsAdded(rootitm, items)
+        for node, itm in zip(nodes, items):
+            if node in expanded:
+                self._inner.Expand(itm)
+        return list(items)
+
+    def BindEvent(self, evt, handler):
+        if evt == TreeEvent.CONTEXT_MENU:
+            # As with MacTreeCTRL, also bind to item activation for VoiceOver.
+            self._inner.Bind(wx.dataview.EVT_DATAVIEW_ITEM_ACTIVATED, handler)
+        elif evt == TreeEvent.ITEM_SELECTED:
+            handler = self._CoalesceSelection(handler)
+        return self._inner.Bind(self.TreeEventsToWXEvents[evt], handler)
+
+    def DeleteAll(self):
+        self._root = self._model.root = None
+        return self._model.Cleared()
+
+    def DeleteItem(self, itm):
+        return self._model.ItemDeleted(self._model.GetParent(itm), itm)
+
+    def SetItemText(self, itm, text):
+        return self._model.ItemChanged(itm)
+
+    def CollapseChildren(self, itm):
+        return self._inner.Collapse(itm)
 
     def Select(self, itm):
         return self._inner.Select(itm)
@@ -9,6 +9,10 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # Build-time options
 # nuitka-project: --standalone
 # nuitka-project: --enable-plugin=anti-bloat
+# nuitka-project: --lto=yes
+# nuitka-project: --python-flag=no_site
+# nuitka-project: --python-flag=isolated
+# nuitka-project: --nofollow-import-to=pkg_resources
 # nuitka-project-if: {OS} == "Windows":
 #    nuitka-project: --windows-disable-console
 # nuitka-project-if: {OS} == "Darwin":
@@ -21,14 +25,15 @@ import gettext
 import json
 import os
 import platform
+import threading
+import time
 import urllib.request
 import webbrowser
 import wx
 
-from graphviz import ExecutableNotFound as GraphvizNotFound
 from json.decoder import JSONDecodeError
 from menus import AddNodeMenu, NodeContextMenu, PasteDestMenu
-from pkg_resources import packaging
+from packaging.version import Version
 from sys import maxsize
 from tree import (
     __version__,
@@ -37,9 +42,10 @@ from tree import (
     SaveError,
     SelectionError,
     Tree,
+    render_graphviz,
 )
-from treectrl import MacTreeCTRL, TreeEvent, WinTreeCTRL
-from urllib.error import URLError
+from treectrl import MacTreeCTRL, TreeEvent, VirtualTreeCTRL, WinTreeCTRL
+from urllib.error import HTTPError, URLError
 
 _ = gettext.translation("treemendous", fallback=True).gettext
 
@@ -63,17 +69,191 @@ SAVE_WILDCARD = (
 
 GRAPHVIZ_DOWNLOAD_URL = "https://graphviz.org/download/"
 
+# Messages shown by dialogs that can come up many times in a session, translated once.
+
+# Translators: A confirmation message asking if the user wants to delete this node. Options are OK and cancel.
+DELETE_LEAF_MSG = _("Are you sure that you want to delete this node?")
+DELETE_NONLEAF_MSG = _(
+    # Translators: A confirmation message asking if the user wants to delete this node and all of its descendants (children, grandchildren, etc.). Options are OK and cancel.
+    "Are you sure that you want to delete this node and all descendants?"
+)
+GRAPHVIZ_REQUIRED_MSG = _(
+    # Translators: Text of a message shown when the user tries to use a function that requires Graphviz but doesn't have it installed.
+    "Treemendous requires that Graphviz is installed to perform this action, but it could not be found. If you proceed, the Graphviz website will be opened in your web browser so that you can download and install it. During installation, if prompted, please select to have Graphviz added to the system path. You may need to restart Treemendous after installation."
+)
+# Translators: The title of a message box.
+GRAPHVIZ_REQUIRED_TITLE = _("Graphviz required")
+# Translators: The title of a dialog displaying LaTeX source code for the currently opened tree.
+QTREE_TITLE = _("LaTeX source")
+ABOUT_MSG = (
+    f"Treemendous {__version__}\n"
+    "Copyright 2021 Bill Dengler and open-source contributors\n"
+    "Licensed under the Mozilla Public License, v. 2.0: https://mozilla.org/MPL/2.0/"
+)
+
 AUTOUPDATE_ENDPOINT = "https://raw.githubusercontent.com/codeofdusk/treemendous/master/channels/stable.json"
 AUTOUPDATE_SCHEMA_VERSION = 1
+# How long a cached update check is trusted before the server is asked again, in seconds.
+AUTOUPDATE_CACHE_TTL = 6 * 60 * 60
+
+# Relative widths of the status bar fields.
+STATUS_WIDTHS = [-5, -2, -1]
+
+
+# The menu bar, as (title, items) pairs. Items are (ID, label, help text, kind) tuples, or None for a separator.
+# It's built once at import, so that opening another window doesn't translate every string again.
+MENU_BAR = (
+    (
+        # Translators: The name of a menu in the menu bar.
+        _("&File"),
+        (
+            (
+                wx.ID_NEW,
+                # Translators: An item in the file menu.
+                _("&New\tCtrl+n"),
+                # Translators: Help text for "new" in the file menu.
+                _("Creates a new blank Treemendous instance."),
+                wx.ITEM_NORMAL,
+            ),
+            (
+                wx.ID_OPEN,
+                # Translators: An item in the file menu.
+                _("&Open\tCtrl+O"),
+                # Translators: Help text for "open" in the file menu.
+                _("Open an existing tree."),
+                wx.ITEM_NORMAL,
+            ),
+            None,
+            (
+                wx.ID_SAVE,
+                # Translators: An item in the file menu.
+                _("&Save\tCtrl+S"),
+                # Translators: Help text for "save" in the file menu.
+                _("Save this tree to disk."),
+                wx.ITEM_NORMAL,
+            ),
+            (
+                wx.ID_SAVEAS,
+                # Translators: An item in the file menu.
+                _("Save &as...\tShift+Ctrl+S"),
+                # Translators: Help text for "save as" in the file menu.
+                _("Save this tree to a different location."),
+                wx.ITEM_NORMAL,
+            ),
+            None,
+            (
+                wx.ID_EXIT,
+                # Translators: An item in the file menu.
+                _("&Quit\tCtrl+Q"),
+                # Translators: Help text for "quit" in the file menu.
+                _("Exit Treemendous."),
+                wx.ITEM_NORMAL,
+            ),
+        ),
+    ),
+    (
+        # Translators: The name of a menu in the menu bar.
+        _("&Edit"),
+        (
+            (
+                wx.ID_COPY,
+                # Translators: An item in the edit menu.
+                _("Copy\tCTRL+c"),
+                # Translators: Help text for "copy" in the edit menu.
+                _("Copy the currently selected node to the pasteboard."),
+                wx.ITEM_NORMAL,
+            ),
+            (
+                wx.ID_PASTE,
+                # Translators: An item in the edit menu.
+                _("Paste\tCTRL+v"),
+                _(
+                    # Translators: Help text for "paste" in the edit menu.
+                    "Place the contents of the pasteboard in the tree at the specified position."
+                ),
+                wx.ITEM_NORMAL,
+            ),
+        ),
+    ),
+    (
+        # Translators: The name of a menu in the menu bar.
+        _("&View"),
+        (
+            (
+                wx.ID_ANY,
+                # Translators: An item in the "view" menu.
+                _("&Visual"),
+                _(
+                    # Translators: Help text for "visual" in the view menu.
+                    "Show a graphical representation of this tree."
+                ),
+                wx.ITEM_NORMAL,
+            ),
+            (
+                wx.ID_ANY,
+                # Translators: An item in the "view" menu that toggles the display of the notes window.
+                # The notes window allows users to enter freeform text along with their tree.
+                _("&Notes"),
+                _(
+                    # Translators: Help text for "notes" in the view menu.
+                    "Show or hide the notes window, which allows entry of freeform text to be shown along with the tree."
+                ),
+                wx.ITEM_CHECK,
+            ),
+            (
+                wx.ID_ANY,
+                # Translators: An item in the "view" menu.
+                _("La&TeX (Qtree)"),
+                _(
+                    # Translators: Help text for "LaTeX" in the view menu.
+                    "Show this tree as source code suitable for pasting into a LaTeX document. Requires that the qtree package be included in the document preamble."
+                ),
+                wx.ITEM_NORMAL,
+            ),
+        ),
+    ),
+    (
+        # Translators: The name of a menu in the menu bar.
+        _("&Help"),
+        (
+            (
+                wx.ID_ABOUT,
+                # Translators: An item in the help menu.
+                _("&About\tF1"),
+                # Translators: Help text for the "about" option in the help menu. Please indicate that this dialog is always in English.
+                _("View version and licence."),
+                wx.ITEM_NORMAL,
+            ),
+        ),
+    ),
+)
+
+
+def append_menu_items(menu, items):
+    "Appends items from a MENU_BAR entry to menu, and returns the new menu items (without separators)."
+    res = []
+    for item in items:
+        if item is None:
+            menu.AppendSeparator()
+            continue
+        id, label, help, kind = item
+        res.append(menu.Append(wx.MenuItem(menu, id, label, help, kind=kind)))
+    return res
+
+
+def remove_after(thread, path):
+    "Removes the file at path once thread, which reads it, has finished."
+    thread.join()
+    os.remove(path)
 
 
 class EditNodeDialog(wx.Dialog):
-    def __init__(self, title, label=None, value=None):
+    def __init__(self, title, label=None, value=None, parent=None):
         if label is None:
             label = ""
         if value is None:
             value = ""
-        super().__init__(parent=None, title=title)
+        super().__init__(parent=parent, title=title)
         panel = wx.Panel(self)
         vbox = wx.BoxSizer(wx.VERTICAL)
         fgs = wx.FlexGridSizer(2, 2, 5, 5)
@@ -115,6 +295,13 @@ class EditNodeDialog(wx.Dialog):
         # bring everything together
         panel.SetSizer(vbox)
 
+    def Reset(self, title, label=None, value=None):
+        "Prepares the dialog to be shown again with new contents."
+        self.SetTitle(title)
+        self.label.SetValue(label or "")
+        self.value.SetValue(value or "")
+        self.label.SetFocus()
+
 
 class ReadOnlyViewDialog(wx.Dialog):
     def __init__(self, title, text):
@@ -143,29 +330,51 @@ class VisualViewDialog(wx.Dialog):
     def __init__(self, path, platform):
         self.path = path
         self.platform = platform
-        file = wx.Image(path, wx.BITMAP_TYPE_ANY).ConvertToBitmap()
-        (self.imgWidth, self.imgHeight) = (file.GetWidth(), file.GetHeight())
-        self.imgSize = wx.Size(self.imgWidth, self.imgHeight)
-        self.imgProportion = self.imgWidth / self.imgHeight
+        self.bmp = None
 
         super().__init__(
             parent=None,
             # Translators: The title of a dialog used to show the visual representation of a tree.
             title=_("Visual rendering"),
             style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER,
-            size=self.imgSize,
         )
+        self.scaleQuality = wx.INTERPOLATION_FAST
+        self.scaleTimer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.OnScaleTimer, self.scaleTimer)
         self.Bind(wx.EVT_SIZE, self.OnSize)
         self.mainSizer = wx.BoxSizer(wx.VERTICAL)
-        self.bmp = wx.Bitmap(self.path)
-        self.img = wx.StaticBitmap(
-            self, wx.ID_ANY, self.bmp, (0, 0), (self.imgWidth, self.imgHeight)
+        self.img = wx.StaticText(
+            self,
+            # Translators: Shown in place of the visual rendering of a tree while the image is loading.
+            label=_("Loading..."),
         )
         self.Bind(
             wx.EVT_CHAR_HOOK, self.onCharHook
         )  ## Use EVT_CHAR_HOOK here, because dialogs don't send EVT_KEY_DOWN on all platforms
         self.mainSizer.Add(self.img, proportion=1, flag=wx.EXPAND | wx.ALL, border=15)
         self.SetSizerAndFit(self.mainSizer)
+        # Large renderings take a while to decode, so do it off the UI thread.
+        self.decoder = threading.Thread(target=self._DecodeImage, daemon=True)
+        self.decoder.start()
+
+    def _DecodeImage(self):
+        image = wx.Image(self.path, wx.BITMAP_TYPE_ANY)
+        wx.CallAfter(self._ShowImage, image)
+
+    def _ShowImage(self, image):
+        if not self:  # The dialog was closed before the image finished loading
+            return
+        self.bmp = image.ConvertToBitmap()
+        (self.imgWidth, self.imgHeight) = (self.bmp.GetWidth(), self.bmp.GetHeight())
+        self.imgSize = wx.Size(self.imgWidth, self.imgHeight)
+        self.imgProportion = self.imgWidth / self.imgHeight
+        img = wx.StaticBitmap(
+            self, wx.ID_ANY, self.bmp, (0, 0), (self.imgWidth, self.imgHeight)
+        )
+        self.mainSizer.Replace(self.img, img)
+        self.img.Destroy()
+        self.img = img
+        self.Fit()
 
     def onCharHook(self, event):
         key = event.GetKeyCode()
@@ -174,6 +383,13 @@ class VisualViewDialog(wx.Dialog):
         event.Skip()
 
     def OnSize(self, event):
+        # Scaling is slow, so wait until resizing pauses. Show a quick scale first, then a smooth one once it settles.
+        self.scaleQuality = wx.INTERPOLATION_FAST
+        self.scaleTimer.StartOnce(50)
+
+    def OnScaleTimer(self, event):
+        if self.bmp is None:
+            return
         (dialogWidth, dialogHeight) = self.GetClientSize()
         dialogProportion = dialogWidth / dialogHeight
         if dialogProportion > self.imgProportion:
@@ -183,24 +399,53 @@ class VisualViewDialog(wx.Dialog):
             newHeight = self.imgHeight * (dialogWidth / self.imgWidth)
             newWidth = dialogWidth
         # make sure we're scaling from a fresh load of the image
-        self.img.SetBitmap(self.scaleBitmap(self.bmp, newWidth, newHeight))
+        self.img.SetBitmap(self.scaleBitmap(newWidth, newHeight, self.scaleQuality))
         self.Refresh()
-
-    def scaleBitmap(self, bitmap, width, height):
-        image = bitmap.ConvertToImage()
-        image = image.Scale(round(width), round(height), wx.IMAGE_QUALITY_HIGH)
-        result = wx.Bitmap(image)
+        if self.scaleQuality != wx.INTERPOLATION_BEST:
+            self.scaleQuality = wx.INTERPOLATION_BEST
+            self.scaleTimer.StartOnce(150)
+
+    def scaleBitmap(self, width, height, quality):
+        # Draw through a graphics context, so the platform's renderer does the resampling
+        # instead of a round trip through wx.Image.
+        width, height = max(round(width), 1), max(round(height), 1)
+        result = wx.Bitmap(width, height)
+        dc = wx.MemoryDC(result)
+        dc.SetBackground(wx.WHITE_BRUSH)
+        dc.Clear()
+        gc = wx.GraphicsContext.Create(dc)
+        gc.SetInterpolationQuality(quality)
+        gc.DrawBitmap(self.bmp, 0, 0, width, height)
+        del gc  # The context only finishes drawing when it is destroyed
+        dc.SelectObject(wx.NullBitmap)
         return result
 
 
 class Editor(wx.Frame):
-    def __init__(self, path=None, system=None):
+    def __init__(self, path=None, system=None, virtual=False):
         wx.Frame.__init__(self, parent=None, title="Treemendous")
 
         # Variables.
         self.tree = Tree()
         self.treectrl = None
-        self._expanded = []
+        self.virtual = virtual
+        self._expanded = set()
+        # Dialogs that can be shown many times are created on first use and kept for the life of the frame, which destroys them.
+        self._editDlg = None
+        self._deleteDlg = None
+        self._graphvizDlg = None
+        self._aboutDlg = None
+        self._notesShown = None
+        self._renderPending = False
+        self._pendingChanged = None
+        self._visualPending = False
+        # Tree control shortcuts, keyed by (alt pressed, key code).
+        self._keymap = {
+            (True, wx.WXK_UP): self.OnMoveUp,
+            (True, wx.WXK_DOWN): self.OnMoveDown,
+            (False, wx.WXK_F2): self.OnEditNode,
+            (False, wx.WXK_DELETE): self.OnDeleteNode,
+        }
         if system:
             self.platform = system
         else:
@@ -221,155 +466,55 @@ class Editor(wx.Frame):
 
         self.AutoUpdate()
 
-        # Setting up menubar.
-        menubar = wx.MenuBar()
+        self.SetMenuBar(self._BuildMenuBar())
+        self._BuildLayout()
+        # Pop-up menus are built once and adjusted to the selection each time they're shown.
+        self.addNodeMenu = AddNodeMenu(self)
+        self.pasteDestMenu = PasteDestMenu(self)
+        self.nodeContextMenu = NodeContextMenu(self)
 
-        file = wx.Menu()
-        new = wx.MenuItem(
-            file,
-            wx.ID_NEW,
-            # Translators: An item in the file menu.
-            _("&New\tCtrl+n"),
-            # Translators: Help text for "new" in the file menu.
-            _("Creates a new blank Treemendous instance."),
-        )
-        file.Append(new)
-
-        open = wx.MenuItem(
-            file,
-            wx.ID_OPEN,
-            # Translators: An item in the file menu.
-            _("&Open\tCtrl+O"),
-            # Translators: Help text for "open" in the file menu.
-            _("Open an existing tree."),
-        )
-        file.Append(open)
-        file.AppendSeparator()
-
-        save = wx.MenuItem(
-            file,
-            wx.ID_SAVE,
-            # Translators: An item in the file menu.
-            _("&Save\tCtrl+S"),
-            # Translators: Help text for "save" in the file menu.
-            _("Save this tree to disk."),
-        )
-        file.Append(save)
-
-        saveas = wx.MenuItem(
-            file,
-            wx.ID_SAVEAS,
-            # Translators: An item in the file menu.
-            _("Save &as...\tShift+Ctrl+S"),
-            # Translators: Help text for "save as" in the file menu.
-            _("Save this tree to a different location."),
-        )
-        file.Append(saveas)
-        file.AppendSeparator()
-
-        quit = wx.MenuItem(
-            file,
-            wx.ID_EXIT,
-            # Translators: An item in the file menu.
-            _("&Quit\tCtrl+Q"),
-            # Translators: Help text for "quit" in the file menu.
-            _("Exit Treemendous."),
-        )
-        file.Append(quit)
-
-        edit = wx.Menu()
-        copy = wx.MenuItem(
-            edit,
-            wx.ID_COPY,
-            # Translators: An item in the edit menu.
-            _("Copy\tCTRL+c"),
-            # Translators: Help text for "copy" in the edit menu.
-            "Copy the currently selected node to the pasteboard.",
-        )
-        paste = wx.MenuItem(
-            edit,
-            wx.ID_PASTE,
-            # Translators: An item in the edit menu.
-            _("Paste\tCTRL+v"),
-            _(
-                # Translators: Help text for "paste" in the edit menu.
-                "Place the contents of the pasteboard in the tree at the specified position."
-            ),
-        )
-        edit.Append(copy)
-        edit.Append(paste)
+        self.Bind(wx.EVT_MENU, self.NewInstance, id=wx.ID_NEW)
+        self.Bind(wx.EVT_MENU, self.OnOpenFile, id=wx.ID_OPEN)
+        self.Bind(wx.EVT_MENU, self.OnSaveFile, id=wx.ID_SAVE)
+        self.Bind(wx.EVT_MENU, self.OnSaveAsFile, id=wx.ID_SAVEAS)
+        self.Bind(wx.EVT_MENU, self.QuitApplication, id=wx.ID_EXIT)
+        self.Bind(wx.EVT_MENU, self.OnCopy, id=wx.ID_COPY)
+        self.Bind(wx.EVT_MENU, self.OnPaste, id=wx.ID_PASTE)
+        self.Bind(wx.EVT_MENU, self.OnEditNode, id=wx.ID_EDIT)
+        self.Bind(wx.EVT_MENU, self.OnDeleteNode, id=wx.ID_DELETE)
+        self.Bind(wx.EVT_MENU, self.OnViewVisual, self.viewVisualMenuItem)
+        self.Bind(wx.EVT_MENU, self.OnToggleNotes, self.NotesCheckBox)
+        self.Bind(wx.EVT_MENU, self.OnQtree, self.qtreeMenuItem)
+        self.Bind(wx.EVT_MENU, self.OnAbout, id=wx.ID_ABOUT)
+        self.Bind(wx.EVT_CLOSE, self.QuitApplication)
 
-        view = wx.Menu()
-        self.viewVisualMenuItem = wx.MenuItem(
-            view,
-            wx.ID_ANY,
-            # Translators: An item in the "view" menu.
-            _("&Visual"),
-            _(
-                # Translators: Help text for "visual" in the view menu.
-                "Show a graphical representation of this tree."
-            ),
-        )
-        view.Append(self.viewVisualMenuItem)
-        self.NotesCheckBox = wx.MenuItem(
-            view,
-            wx.ID_ANY,
-            # Translators: An item in the "view" menu that toggles the display of the notes window.
-            # The notes window allows users to enter freeform text along with their tree.
-            _("&Notes"),
-            _(
-                # Translators: Help text for "notes" in the view menu.
-                "Show or hide the notes window, which allows entry of freeform text to be shown along with the tree."
-            ),
-            kind=wx.ITEM_CHECK,
-        )
-        view.Append(self.NotesCheckBox)
-        self.qtreeMenuItem = wx.MenuItem(
-            view,
-            wx.ID_ANY,
-            # Translators: An item in the "view" menu.
-            _("La&TeX (Qtree)"),
-            _(
-                # Translators: Help text for "LaTeX" in the view menu.
-                "Show this tree as source code suitable for pasting into a LaTeX document. Requires that the qtree package be included in the document preamble."
-            ),
-        )
-        view.Append(self.qtreeMenuItem)
-
-        help = wx.Menu()
-        about = wx.MenuItem(
-            help,
-            wx.ID_ABOUT,
-            # Translators: An item in the help menu.
-            _("&About\tF1"),
-            # Translators: Help text for the "about" option in the help menu. Please indicate that this dialog is always in English.
-            _("View version and licence."),
-        )
-        help.Append(about)
+        self.StatusBar()
 
-        menubar.Append(
-            file,
-            # Translators: The name of a menu in the menu bar.
-            _("&File"),
-        )
-        menubar.Append(
-            edit,
-            # Translators: The name of a menu in the menu bar.
-            _("&Edit"),
-        )
-        menubar.Append(
-            view,
-            # Translators: The name of a menu in the menu bar.
-            _("&View"),
-        )
-        menubar.Append(
-            help,
-            # Translators: The name of a menu in the menu bar.
-            _("&Help"),
-        )
+        self.Centre()
+
+        if path is not None:
+            self.OpenTree(path)
+
+        self.RenderTree()
+
+        notesenabled = bool(self.tree.notes)
+        self.EnableNotes(notesenabled)
 
-        self.SetMenuBar(menubar)
+        self.Show()
 
+    def _BuildMenuBar(self):
+        "Returns a menu bar populated from MENU_BAR."
+        menubar = wx.MenuBar()
+        menus = []
+        for title, items in MENU_BAR:
+            menu = wx.Menu()
+            menus.append(append_menu_items(menu, items))
+            menubar.Append(menu, title)
+        self.viewVisualMenuItem, self.NotesCheckBox, self.qtreeMenuItem = menus[2]
+        return menubar
+
+    def _BuildLayout(self):
+        "Creates the main panel with the tree, notes field and add button."
         self.panel = wx.Panel(self)
 
         notesSizer = wx.BoxSizer(wx.VERTICAL)
@@ -385,6 +530,8 @@ class Editor(wx.Frame):
         notesSizer.Add(self.notesField, flag=wx.EXPAND | wx.TOP | wx.BOTTOM)
 
         self.notesField.Bind(wx.EVT_TEXT, self.OnNotesChanged)
+        self.notesTimer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.FlushNotes, self.notesTimer)
 
         self.addNodeButton = wx.Button(
             self.panel,
@@ -393,21 +540,6 @@ class Editor(wx.Frame):
         )
         self.addNodeButton.Bind(wx.EVT_BUTTON, self.OnAddNode)
 
-        self.Bind(wx.EVT_MENU, self.NewInstance, id=wx.ID_NEW)
-        self.Bind(wx.EVT_MENU, self.OnOpenFile, id=wx.ID_OPEN)
-        self.Bind(wx.EVT_MENU, self.OnSaveFile, id=wx.ID_SAVE)
-        self.Bind(wx.EVT_MENU, self.OnSaveAsFile, id=wx.ID_SAVEAS)
-        self.Bind(wx.EVT_MENU, self.QuitApplication, id=wx.ID_EXIT)
-        self.Bind(wx.EVT_MENU, self.OnCopy, id=wx.ID_COPY)
-        self.Bind(wx.EVT_MENU, self.OnPaste, id=wx.ID_PASTE)
-        self.Bind(wx.EVT_MENU, self.OnEditNode, id=wx.ID_EDIT)
-        self.Bind(wx.EVT_MENU, self.OnDeleteNode, id=wx.ID_DELETE)
-        self.Bind(wx.EVT_MENU, self.OnViewVisual, self.viewVisualMenuItem)
-        self.Bind(wx.EVT_MENU, self.OnToggleNotes, self.NotesCheckBox)
-        self.Bind(wx.EVT_MENU, self.OnQtree, self.qtreeMenuItem)
-        self.Bind(wx.EVT_MENU, self.OnAbout, id=wx.ID_ABOUT)
-        self.Bind(wx.EVT_CLOSE, self.QuitApplication)
-
         fgs = wx.FlexGridSizer(3, 1, 5, 5)
         self.InitTree()
         fgs.Add(self.treectrl.widget, wx.ID_ANY, wx.EXPAND | wx.ALL, border=3)
@@ -424,22 +556,11 @@ class Editor(wx.Frame):
 
         self.panel.SetSizer(fgs)
 
-        self.StatusBar()
-
-        self.Centre()
-
-        if path is not None:
-            self.OpenTree(path)
-
-        self.RenderTree()
-
-        notesenabled = bool(self.tree.notes)
-        self.EnableNotes(notesenabled)
-
-        self.Show()
-
     def InitTree(self):
-        ctrl = WinTreeCTRL if self.platform == "Windows" else MacTreeCTRL
+        if self.virtual:
+            ctrl = VirtualTreeCTRL
+        else:
+            ctrl = WinTreeCTRL if self.platform == "Windows" else MacTreeCTRL
         self.treectrl = ctrl(self.panel, wx.ID_ANY, wx.DefaultPosition, wx.DefaultSize)
         self.treectrl.BindEvent(TreeEvent.ITEM_SELECTED, self.OnSelectionChanged)
         self.treectrl.BindEvent(TreeEvent.ITEM_EXPANDED, self.OnExpand)
@@ -447,37 +568,48 @@ class Editor(wx.Frame):
         self.treectrl.BindEvent(TreeEvent.CONTEXT_MENU, self.OnNodeContextMenu)
         self.treectrl.BindEvent(TreeEvent.KEY_DOWN, self.OnTreeKeyDown)
 
-    def RenderTree(self):
+    def RenderTree(self, changed=None):
+        "Shows the tree in the tree control. If only the subtree under changed was modified, pass it to skip the rest."
         sel = self.tree.selection
-        root = None
-        toExpand = []
-
-        def _initializeLevel(guiRoot, treeRoot):
-            r = self.treectrl.AddChild(guiRoot, treeRoot, treeRoot in self._expanded)
-            if treeRoot == sel:
-                self.treectrl.Select(r)
-            for c in treeRoot.children:
-                _initializeLevel(r, c)
-
         self.UpdateName()
 
         self.viewVisualMenuItem.Enable(not self.tree.is_empty)
         self.qtreeMenuItem.Enable(not self.tree.is_empty)
 
-        if not self.treectrl:
-            self.InitTree()
-        else:
-            self.treectrl.DeleteAll()
-        if not self.tree.is_empty:
-            root = self.treectrl.AddRoot(
-                self.tree.root, self.tree.root in self._expanded
-            )
-            if sel is None or sel == self.tree.root:
-                self.treectrl.Select(root)
-            for c in self.tree.root.children:
-                _initializeLevel(root, c)
+        # The tree control batches its own updates, but freezing the frame as well keeps the rest of the window from repainting in between.
+        self.Freeze()
+        try:
+            if not self.treectrl:
+                self.InitTree()
+            with self.treectrl:
+                self.treectrl.Sync(self.tree.root, self._expanded, sel, changed)
+                if not self.tree.is_empty:
+                    itm = self.treectrl.GetItemFromNode(sel)
+                    if itm is None:
+                        itm = self.treectrl.GetItemFromNode(self.tree.root)
+                    self.treectrl.Select(itm)
+        finally:
+            self.Thaw()
         self.treectrl.widget.SetFocus()
 
+    def RenderTreeLater(self, changed=None):
+        "Like RenderTree, but waits for pending events first, so that several changes in a row (like a held down shortcut) are shown in one render."
+        if self._renderPending:
+            if changed is not self._pendingChanged:
+                self._pendingChanged = None
+            return
+        self._renderPending = True
+        self._pendingChanged = changed
+        wx.CallAfter(self._RenderPending)
+
+    def _RenderPending(self):
+        if not self:  # The window was closed in the meantime
+            return
+        changed = self._pendingChanged
+        self._renderPending = False
+        self._pendingChanged = None
+        self.RenderTree(changed)
+
     def UpdateName(self):
         title = "Treemendous"
         if self.tree.last_path:
@@ -488,24 +620,77 @@ class Editor(wx.Frame):
         self.SetTitle(title)
 
     def AutoUpdate(self):
+        "Checks for updates on a background thread, so that a slow network doesn't hold up startup."
+        cache = os.path.join(
+            wx.StandardPaths.Get().GetUserLocalDataDir(), "update_cache.json"
+        )
+        threading.Thread(
+            target=self._FetchUpdateInfo, args=(cache,), daemon=True
+        ).start()
+
+    def _FetchUpdateInfo(self, cache):
+        # Runs on the update thread, so nothing here may touch the UI.
         try:
-            req = urllib.request.Request(
-                AUTOUPDATE_ENDPOINT,
-                headers={
-                    "User-Agent": f"Mozilla/5.0 (compatible; python-Treemendous/{__version__}; +https://github.com/codeofdusk/treemendous)"
-                },
-            )
-            resp = json.loads(urllib.request.urlopen(req, timeout=10).read())
+            with open(cache, "rb") as fin:
+                cached = json.load(fin)
+            age = time.time() - os.path.getmtime(cache)
+        except (OSError, ValueError):
+            cached = None
+        if not isinstance(cached, dict) or not isinstance(cached.get("response"), dict):
+            cached = None  # A damaged or hand-edited cache is as good as none
+        if cached is not None and age < AUTOUPDATE_CACHE_TTL:
+            return wx.CallAfter(self._ApplyUpdateInfo, cached["response"])
+        headers = {
+            "User-Agent": f"Mozilla/5.0 (compatible; python-Treemendous/{__version__}; +https://github.com/codeofdusk/treemendous)"
+        }
+        if cached is not None:
+            # Let the server answer 304 Not Modified if the channel hasn't changed since it was cached.
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        try:
+            req = urllib.request.Request(AUTOUPDATE_ENDPOINT, headers=headers)
+            with urllib.request.urlopen(req, timeout=10) as fin:
+                resp = json.load(fin)
+                cached = {
+                    "etag": fin.headers.get("ETag"),
+                    "last_modified": fin.headers.get("Last-Modified"),
+                    "response": resp,
+                }
+        except HTTPError as e:
+            if e.code != 304 or cached is None:
+                return self._UpdateCheckFailed(e)
+            resp = cached["response"]
         except (URLError, JSONDecodeError) as e:
-            # Translators: Part of a message printed to the command line when the update check could not be completed.
-            UPDATE_FAIL = _("Error while checking for updates:")
-            print(f"{UPDATE_FAIL} {e}")
-            return
+            return self._UpdateCheckFailed(e)
+        self._SaveUpdateCache(cache, cached)
+        wx.CallAfter(self._ApplyUpdateInfo, resp)
+
+    def _UpdateCheckFailed(self, e):
+        # Translators: Part of a message printed to the command line when the update check could not be completed.
+        UPDATE_FAIL = _("Error while checking for updates:")
+        wx.CallAfter(print, f"{UPDATE_FAIL} {e}")
+
+    def _SaveUpdateCache(self, cache, cached):
+        # Write to a temporary file first, so that another instance never reads a partial cache.
+        tmp = f"{cache}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache), exist_ok=True)
+            with open(tmp, "w") as fout:
+                json.dump(cached, fout)
+            os.replace(tmp, cache)
+        except OSError:
+            pass  # The cache only saves a download next time, so failing to write it isn't an error
+
+    def _ApplyUpdateInfo(self, resp):
+        if not self:
+            return  # The window was closed before the update check finished
         if AUTOUPDATE_SCHEMA_VERSION < resp.get("schema_version", maxsize):
             return self.UpdateAvailable(required=True)
-        my_version = packaging.version.parse(__version__)
-        latest_version = packaging.version.parse(resp["latest_version"])
-        minimum_version = packaging.version.parse(resp["minimum_version"])
+        my_version = Version(__version__)
+        latest_version = Version(resp["latest_version"])
+        minimum_version = Version(resp["minimum_version"])
         if my_version < minimum_version:
             return self.UpdateAvailable(
                 version=resp["latest_version"], page=resp["release_page"], required=True
@@ -518,11 +703,12 @@ class Editor(wx.Frame):
             )
 
     def NewInstance(self, event):
-        editor = Editor(system=self.platform)
+        editor = Editor(system=self.platform, virtual=self.virtual)
         editor.Centre()
         editor.Show()
 
     def OnOpenFile(self, event):
+        self.FlushNotes()
         file_name = os.path.basename(self.tree.last_path)
 
         if self.tree.dirty:
@@ -548,7 +734,7 @@ class Editor(wx.Frame):
     def OpenTree(self, path):
         try:
             self.tree = Tree(path)
-            self._expanded = []
+            self._expanded = set()
             self.EnableNotes(bool(self.tree.notes))
         except (IncompatibleFormatError, IOError) as e:
             dlg = wx.MessageDialog(
@@ -579,6 +765,7 @@ class Editor(wx.Frame):
         open_dlg.Destroy()
 
     def OnSaveFile(self, event):
+        self.FlushNotes()
         try:
             self.tree.save()
             self.statusbar.SetStatusText("", 1)
@@ -590,6 +777,7 @@ class Editor(wx.Frame):
             self.OnSaveAsFile(event)
 
     def OnSaveAsFile(self, event):
+        self.FlushNotes()
         save_dlg = wx.FileDialog(
             self,
             # Translators: The title of the "save tree as" dialog.
@@ -618,6 +806,9 @@ class Editor(wx.Frame):
                 if msg.ShowModal() != wx.ID_OK:
                     return
 
+            # Importing graphviz is slow, so defer it until something might render.
+            from graphviz import ExecutableNotFound as GraphvizNotFound
+
             try:
                 self.tree.save(path=path)
                 self.statusbar.SetStatusText(self.tree.last_path + " Saved", 0)
@@ -633,6 +824,7 @@ class Editor(wx.Frame):
         save_dlg.Destroy()
 
     def QuitApplication(self, event):
+        self.FlushNotes()
         if self.tree.dirty:
             dlg = wx.MessageDialog(
                 self,
@@ -659,36 +851,58 @@ class Editor(wx.Frame):
     def OnExpand(self, event):
         itm = event.GetItem()
         if itm.IsOk:
-            self._expanded.append(self.treectrl.GetNodeFromItem(itm))
+            self._expanded.add(self.treectrl.GetNodeFromItem(itm))
 
     def OnCollapse(self, event):
         itm = event.GetItem()
         if itm.IsOk:
-            self._expanded.remove(self.treectrl.GetNodeFromItem(itm))
+            self._expanded.discard(self.treectrl.GetNodeFromItem(itm))
             self.treectrl.CollapseChildren(itm)
 
     def OnNotesChanged(self, event):
+        # Wait for a pause in typing rather than updating the tree and title on every keystroke.
+        self.notesTimer.StartOnce(200)
+
+    def FlushNotes(self, event=None):
+        "Copies pending edits from the notes field into the tree."
+        if not self.notesTimer.IsRunning() and event is None:
+            return
+        self.notesTimer.Stop()
+        wasDirty = self.tree.dirty
         self.tree.notes = self.notesField.GetValue()
-        self.UpdateName()
+        if not wasDirty:
+            self.UpdateName()
 
     def OnToggleNotes(self, event):
         notesenabled = not self.notesField.Shown
         self.EnableNotes(notesenabled)
 
     def EnableNotes(self, notesenabled):
-        # Changing the value of the notes field causes self.notes to be updated and the dirty flag to be set.
-        # Unbind the event handler temporarily when  refreshing the field to avoid this.
-        self.notesField.Unbind(wx.EVT_TEXT)
-        self.notesField.SetValue(self.tree.notes)
-        self.notesField.Bind(wx.EVT_TEXT, self.OnNotesChanged)
+        # Don't let the refresh below throw away edits that haven't reached the tree yet.
+        self.FlushNotes()
+        # SetValue would fire EVT_TEXT, updating self.notes and setting the dirty flag.
+        # ChangeValue refreshes the field without sending the event.
+        self.notesField.ChangeValue(self.tree.notes)
+        if notesenabled == self._notesShown:
+            # Nothing to show or hide, so skip the relayout.
+            return
+        self._notesShown = notesenabled
         self.notesLbl.Show(notesenabled)
         self.notesField.Show(notesenabled)
         self.NotesCheckBox.Check(notesenabled)
         self.panel.GetSizer().Layout()  # Update control sizing after show/hide
 
+    def GetEditNodeDialog(self, title, label=None, value=None):
+        "Returns the shared edit node dialog, ready to be shown with the given contents."
+        if self._editDlg is None:
+            self._editDlg = EditNodeDialog(title=title, parent=self)
+        self._editDlg.Reset(title, label, value)
+        return self._editDlg
+
     def OnAddNode(self, event):
         if not self.tree.is_empty:
-            self.PopupMenu(AddNodeMenu(self))
+            self.addNodeMenu.Prepare()
+            self.PopupMenu(self.addNodeMenu)
         else:
             self.DoAddChild()
 
@@ -700,43 +914,44 @@ class Editor(wx.Frame):
             # Translators: The name of the dialog for adding a child (contained item) to a node labelled {label}.
             else _("Add child of {label}").format(label=self.tree.selection.label)
         )
-        dlg = EditNodeDialog(title=title)
+        dlg = self.GetEditNodeDialog(title)
         if dlg.ShowModal() == wx.ID_OK:
             self.tree.add(Location.CHILD, dlg.label.GetValue(), dlg.value.GetValue())
-            self.RenderTree()
-        dlg.Destroy()
+            # The new node is selected, and only its parent's children changed.
+            self.RenderTree(changed=self.tree.selection.parent)
 
     def DoAddParent(self):
         # Translators: The name of the dialog for adding a parent (containg item) to a node labelled {label}.
         title = _("Add parent of {label}").format(label=self.tree.selection.label)
-        dlg = EditNodeDialog(title=title)
+        dlg = self.GetEditNodeDialog(title)
         if dlg.ShowModal() == wx.ID_OK:
             self.tree.add(Location.PARENT, dlg.label.GetValue(), dlg.value.GetValue())
-            self.RenderTree()
-        dlg.Destroy()
+            # The new node is selected, and only its parent's children changed.
+            self.RenderTree(changed=self.tree.selection.parent)
 
     def DoAddSibling(self):
         # Translators: The name of the dialog for adding a sibling (item on same level) to a node labelled {label}.
         title = _("Add sibling of {label}").format(label=self.tree.selection.label)
-        dlg = EditNodeDialog(title=title)
+        dlg = self.GetEditNodeDialog(title)
         if dlg.ShowModal() == wx.ID_OK:
             self.tree.add(Location.SIBLING, dlg.label.GetValue(), dlg.value.GetValue())
-            self.RenderTree()
-        dlg.Destroy()
+            # The new node is selected, and only its parent's children changed.
+            self.RenderTree(changed=self.tree.selection.parent)
 
     def OnCopy(self, event):
         self.tree.copy()
 
     def OnPaste(self, event):
         if not self.tree.is_empty:
-            self.PopupMenu(PasteDestMenu(self, event))
+            self.pasteDestMenu.Prepare(event)
+            self.PopupMenu(self.pasteDestMenu)
         else:
             self.DoPaste(Location.CHILD, event)
 
     def DoPaste(self, location, event):
         try:
             self.tree.paste(location)
-            self.RenderTree()
+            self.RenderTree(changed=self.tree.selection.parent)
         except SelectionError:  # Raised when the pasteboard is empty
             event.Skip()
 
@@ -752,80 +967,73 @@ class Editor(wx.Frame):
     def OnNodeContextMenu(self, event):
         if self.tree.is_empty:
             return event.Skip()
-        self.PopupMenu(NodeContextMenu(self))
+        self.nodeContextMenu.Prepare()
+        self.PopupMenu(self.nodeContextMenu)
 
     def OnTreeKeyDown(self, event):
         keycode = event.GetKeyCode()
-        if event.AltDown():
-            if keycode == wx.WXK_UP:
-                return self.OnMoveUp(event)
-            elif keycode == wx.WXK_DOWN:
-                return self.OnMoveDown(event)
-        if keycode == wx.WXK_F2:
-            return self.OnEditNode(event)
-        elif keycode == wx.WXK_DELETE:
-            return self.OnDeleteNode(event)
-        else:
+        handler = self._keymap.get((event.AltDown(), keycode))
+        if handler is None:
+            # Keys without an alt binding behave the same with or without alt.
+            handler = self._keymap.get((False, keycode))
+        if handler is None:
             return event.Skip()
+        return handler(event)
 
     def OnEditNode(self, event):
-        dlg = EditNodeDialog(
+        dlg = self.GetEditNodeDialog(
             # Translators: The name of the dialog for editing a node labelled {label}.
-            title=_("Editing {label}").format(label=self.tree.selection.label),
+            _("Editing {label}").format(label=self.tree.selection.label),
             label=self.tree.selection.label,
             value=self.tree.selection.value,
         )
         if dlg.ShowModal() == wx.ID_OK:
             self.tree.edit(label=dlg.label.GetValue(), value=dlg.value.GetValue())
-            self.RenderTree()
-        dlg.Destroy()
+            # Only the edited node's text changed.
+            self.RenderTree(changed=self.tree.selection)
 
     def OnDeleteNode(self, event):
-        # Translators: A confirmation message asking if the user wants to delete this node. Options are OK and cancel.
-        LEAF_MSG = _("Are you sure that you want to delete this node?")
-        NONLEAF_MSG = _(
-            # Translators: A confirmation message asking if the user wants to delete this node and all of its descendants (children, grandchildren, etc.). Options are OK and cancel.
-            "Are you sure that you want to delete this node and all descendants?"
-        )
-        dlg = wx.MessageDialog(
-            self,
-            LEAF_MSG if not self.tree.selection.children else NONLEAF_MSG,
-            # Translators: Title of a message dialog confirming deletion of the node labelled {label}.
-            _("Delete {label}").format(label=self.tree.selection.label),
-            wx.OK | wx.OK_DEFAULT | wx.CANCEL | wx.ICON_WARNING,
+        if self._deleteDlg is None:
+            self._deleteDlg = wx.MessageDialog(
+                self, "", "", wx.OK | wx.OK_DEFAULT | wx.CANCEL | wx.ICON_WARNING
+            )
+        dlg = self._deleteDlg
+        dlg.SetMessage(
+            DELETE_LEAF_MSG if not self.tree.selection.children else DELETE_NONLEAF_MSG
         )
+        # Translators: Title of a message dialog confirming deletion of the node labelled {label}.
+        dlg.SetTitle(_("Delete {label}").format(label=self.tree.selection.label))
 
         val = dlg.ShowModal()
         if val == wx.ID_OK:
+            # Deleting selects the parent, the only node whose children changed (or None for the root, which needs a full render anyway).
             self.tree.delete()
-            self.RenderTree()
+            self.RenderTree(changed=self.tree.selection)
 
     def OnMoveUp(self, event):
         self.tree.move_up()
-        self.RenderTree()
+        self.RenderTreeLater(changed=self.tree.selection.parent)
 
     def OnMoveDown(self, event):
         self.tree.move_down()
-        self.RenderTree()
+        self.RenderTreeLater(changed=self.tree.selection.parent)
 
     def StatusBar(self):
-        self.statusbar = self.CreateStatusBar()
-        self.statusbar.SetFieldsCount(3)
-        self.statusbar.SetStatusWidths([-5, -2, -1])
+        if self.GetStatusBar() is not None:
+            return
+        self.statusbar = self.CreateStatusBar(len(STATUS_WIDTHS))
+        self.statusbar.SetStatusWidths(STATUS_WIDTHS)
 
     def GetGraphviz(self):
-        dlg = wx.MessageDialog(
-            self,
-            _(
-                # Translators: Text of a message shown when the user tries to use a function that requires Graphviz but doesn't have it installed.
-                "Treemendous requires that Graphviz is installed to perform this action, but it could not be found. If you proceed, the Graphviz website will be opened in your web browser so that you can download and install it. During installation, if prompted, please select to have Graphviz added to the system path. You may need to restart Treemendous after installation."
-            ),
-            # Translators: The title of a message box.
-            _("Graphviz required"),
-            wx.OK | wx.OK_DEFAULT | wx.CANCEL | wx.ICON_QUESTION,
-        )
+        if self._graphvizDlg is None:
+            self._graphvizDlg = wx.MessageDialog(
+                self,
+                GRAPHVIZ_REQUIRED_MSG,
+                GRAPHVIZ_REQUIRED_TITLE,
+                wx.OK | wx.OK_DEFAULT | wx.CANCEL | wx.ICON_QUESTION,
+            )
 
-        val = dlg.ShowModal()
+        val = self._graphvizDlg.ShowModal()
         if val == wx.ID_OK:
             webbrowser.open(GRAPHVIZ_DOWNLOAD_URL)
 
@@ -873,44 +1081,74 @@ class Editor(wx.Frame):
         dlg = wx.MessageDialog(self, f"{body}\n{footer}", title, flags)
 
         val = dlg.ShowModal()
+        dlg.Destroy()
         if val == wx.ID_OK:
             if page:
                 webbrowser.open(page)
-            raise RuntimeError("Update requested, exiting.")
+            # The update check finishes after startup, so close normally to give a chance to save changes.
+            self.Close()
 
     def OnViewVisual(self, event):
+        if self._visualPending:
+            return
+        # Graphviz can take a while on large trees, so only build the graph here and leave the rendering to a background thread.
+        # The graph is a snapshot, so the tree can keep changing in the meantime.
+        graph = self.tree.to_graphviz(dpi=200)
+        self._visualPending = True
+        # Translators: Shown in the status bar while the visual rendering of a tree is being prepared.
+        self.statusbar.SetStatusText(_("Rendering..."), 0)
+        threading.Thread(target=self._RenderVisual, args=(graph,), daemon=True).start()
+
+    def _RenderVisual(self, graph):
+        path = error = None
         try:
-            path = self.tree.graphviz(dpi=200)
-        except GraphvizNotFound:
-            self.GetGraphviz()
-        else:
-            dlg = VisualViewDialog(path, self.platform)
+            path = render_graphviz(graph)
+        except Exception as e:
+            # Hand every failure to _ShowVisual, which must always run to clear the pending state.
+            error = e
+        wx.CallAfter(self._ShowVisual, path, error)
+
+    def _ShowVisual(self, path, error=None):
+        from graphviz import ExecutableNotFound as GraphvizNotFound
+
+        if not self:  # The window was closed while rendering
+            if path is not None:
+                os.remove(path)
+            return
+        self._visualPending = False
+        self.statusbar.SetStatusText("", 0)
+        if isinstance(error, GraphvizNotFound):
+            return self.GetGraphviz()
+        if error is not None:
+            dlg = wx.MessageDialog(
+                self,
+                str(error),
+                # Translators: The title of an error dialog shown when a tree could not be rendered visually.
+                _("Error"),
+                wx.ICON_ERROR,
+            )
             dlg.ShowModal()
             dlg.Destroy()
-            os.remove(path)
+            return
+        dlg = VisualViewDialog(path, self.platform)
+        dlg.ShowModal()
+        decoder = dlg.decoder
+        dlg.Destroy()
+        # Clean up in the background so closing the dialog doesn't wait on the file system.
+        # Not a daemon thread, so that quitting still removes the file.
+        threading.Thread(target=remove_after, args=(decoder, path)).start()
 
     def OnQtree(self, event):
-        dlg = ReadOnlyViewDialog(
-            # Translators: The title of a dialog displaying LaTeX source code for the currently opened tree.
-            _("LaTeX source"),
-            self.tree.qtree(),
-        )
+        dlg = ReadOnlyViewDialog(QTREE_TITLE, self.tree.qtree())
         dlg.ShowModal()
         dlg.Destroy()
 
     def OnAbout(self, event):
-        dlg = wx.MessageDialog(
-            self,
-            (
-                f"Treemendous {__version__}\n"
-                "Copyright 2021 Bill Dengler and open-source contributors\n"
-                "Licensed under the Mozilla Public License, v. 2.0: https://mozilla.org/MPL/2.0/"
-            ),
-            "Treemendous",
-            wx.OK | wx.ICON_INFORMATION,
-        )
-        dlg.ShowModal()
-        dlg.Destroy()
+        if self._aboutDlg is None:
+            self._aboutDlg = wx.MessageDialog(
+                self, ABOUT_MSG, "Treemendous", wx.OK | wx.ICON_INFORMATION
+            )
+        self._aboutDlg.ShowModal()
 
 
 if __name__ == "__main__":
@@ -923,7 +1161,12 @@ if __name__ == "__main__":
         help="Override the detected system platform used when drawing the UI (will probably break accessibility, only use for testing)",
         choices=("Windows", "Darwin", "Linux"),
     )
+    parser.add_argument(
+        "--virtual-tree",
+        help="Use a tree control that only creates the rows being shown, for very large trees (screen reader support is untested)",
+        action="store_true",
+    )
     args = parser.parse_args()
     app = wx.App()
-    Editor(path=args.path, system=args.platform)
+    Editor(path=args.path, system=args.platform, virtual=args.virtual_tree)
     app.MainLoop()